@@ -0,0 +1,109 @@
+"""Checks that importing yapl stays fast and free of side effects.
+
+Imports ``yapl.logger`` in fresh interpreters under ``python -X importtime``
+and takes the best cumulative import time of several runs (bytecode is
+cached in a temporary directory, so compiling is not measured). The run
+fails when that time is over the budget, when the import loaded modules
+that should only be imported on first use (modules the interpreter loaded
+at startup do not count), when the default ``Logger`` was already created
+or when a signal handler was installed.
+
+Run from the repository root:
+
+    python -m benchmarks.bench_import
+    python -m benchmarks.bench_import --budget-ms 40 --runs 10
+"""
+
+import subprocess
+import argparse
+import tempfile
+import sys
+import os
+
+BUDGET_MS = 60.0
+RUNS = 7
+MODULE = "yapl.logger"
+# imported when the features needing them are first used
+DEFERRED_MODULES = (
+    "asyncio",
+    "inspect",
+    "multiprocessing",
+    "concurrent.futures",
+    "gzip",
+    "shutil",
+    "traceback",
+    "json",
+    "mmap",
+    "orjson",
+    "yapl.hub",
+    "yapl.aio",
+    "yapl.structured",
+    "yapl.ring",
+)
+STYLE_NAMES = ("stdout_full_info", "stdout", "stdout_simple", "file", "none_style")
+CHECK_SIDE_EFFECTS = f"""
+import signal, sys
+def handlers():
+    return [signal.getsignal(signum) for signum in signal.valid_signals()]
+before = handlers()
+loaded = set(sys.modules)
+import {MODULE} as module
+new = set(sys.modules) - loaded
+styles = vars(sys.modules["yapl.styling.basic_styles"])
+print("deferred modules imported:", *[m for m in {DEFERRED_MODULES!r} if m in new])
+print("default Logger created:", "Logger" in vars(module))
+print("built-in styles compiled:", *[name for name in {STYLE_NAMES!r} if name in styles])
+print("signal handlers changed:", handlers() != before)
+"""
+
+
+def import_time_us(env: dict[str, str]) -> int:
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {MODULE}"],
+        capture_output=True,
+        text=True,
+        env=env,
+        check=True,
+    )
+    for line in proc.stderr.splitlines():
+        _, cumulative, name = line.split("|")
+        if name.strip() == MODULE:
+            return int(cumulative)
+    raise RuntimeError(f"'{MODULE}' missing from the -X importtime output")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[0])
+    parser.add_argument("--budget-ms", type=float, default=BUDGET_MS)
+    parser.add_argument("--runs", type=int, default=RUNS)
+    opts = parser.parse_args()
+
+    failures = []
+    with tempfile.TemporaryDirectory() as pycache:
+        env = dict(os.environ, PYTHONPYCACHEPREFIX=pycache)
+        env.pop("PYTHONDONTWRITEBYTECODE", None)
+        import_time_us(env)
+        best_ms = min(import_time_us(env) for _ in range(opts.runs)) / 1000
+        report = subprocess.run(
+            [sys.executable, "-c", CHECK_SIDE_EFFECTS],
+            capture_output=True,
+            text=True,
+            env=env,
+            check=True,
+        ).stdout
+    print(f"import {MODULE}: {best_ms:.1f} ms (budget {opts.budget_ms:.1f} ms)")
+    if best_ms > opts.budget_ms:
+        failures.append("over the import-time budget")
+    for line in report.splitlines():
+        check, _, value = line.partition(":")
+        value = value.strip()
+        print(f"{check}: {value}")
+        if value not in ("", "False"):
+            failures.append(f"{check} at import time: {value}")
+    for failure in failures:
+        print(f"FAIL: {failure}")
+    sys.exit(1 if failures else 0)
+
+
+if __name__ == "__main__":
+    main()
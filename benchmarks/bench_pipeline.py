@@ -0,0 +1,262 @@
+"""Measures one logging call through the whole pipeline, per scenario.
+
+Every case logs through a fresh ``LoggerContainer`` (event method, datagens,
+style, message preprocessing and the destination's ``log_raw``) and reports
+the time per call plus the memory one call allocates: the peak of what is
+alive while it runs (``peak B``) and what it leaves behind (``kept B``),
+both traced by ``tracemalloc``. Console output goes to ``os.devnull``, files
+to a temporary directory and callbacks only keep their last line, so the
+suite runs offline and leaves nothing behind.
+
+Run from the repository root:
+
+    python -m benchmarks.bench_pipeline
+    python -m benchmarks.bench_pipeline --json before.json
+    python -m benchmarks.bench_pipeline --json after.json --compare before.json
+    python -m benchmarks.bench_pipeline -k destination/ -k fanout
+"""
+
+from yapl.logger import LoggerContainer
+from yapl.basic_datagens import get_caller_location, get_date_and_time
+from yapl.sticky.strs import StickyString
+from yapl.styling import basic_styles
+from yapl.styling.stylingABC import LogStyle
+from typing import Any, Callable, Optional
+import subprocess
+import tracemalloc
+import argparse
+import platform
+import tempfile
+import json
+import time
+import sys
+import os
+
+CALLS = 20_000
+REPEATS = 5
+TRACED_CALLS = 500
+LONG_MESSAGE = "a long message " * 700
+STYLES = {
+    "stdout_full_info": basic_styles.stdout_full_info,
+    "stdout": basic_styles.stdout,
+    "stdout_simple": basic_styles.stdout_simple,
+    "file": basic_styles.file,
+}
+PLAIN_STYLE = LogStyle(
+    "{event}{message}",
+    {"event": "[{event_type}]:", "message": "{message}"},
+    {},
+)
+
+
+class LastLine:
+    # in-memory destination that keeps only the last line it got
+    last: Any = None
+
+    def __call__(self, line: Any) -> None:
+        self.last = line
+
+
+class Case:
+    tmp: str
+    __container: LoggerContainer
+    __destinations: list[Any]
+    call: Callable[[int], None]
+
+    def __init__(self, tmp: str) -> None:
+        self.tmp = tmp
+        self.__container = LoggerContainer()
+        self.__container.update_optional_datagens("location", get_caller_location)
+        self.__container.update_optional_datagens("date and time", get_date_and_time)
+        self.__destinations = []
+
+    def add(self, destination: Any, *args: Any, **kwargs: Any) -> Any:
+        if isinstance(destination, str) and destination != "stdout":
+            destination = os.path.join(self.tmp, destination)
+        self.__container.add_log_destination(destination, *args, **kwargs)
+        self.__destinations.append(destination)
+        return self.__container[destination]
+
+    def logger(self) -> Any:
+        return self.__container()
+
+    def close(self) -> None:
+        for destination in self.__destinations:
+            self.__container[destination].close()
+
+
+def case_filtered(case: Case) -> None:
+    case.add(LastLine(), PLAIN_STYLE).verbosity = 1
+    lgr = case.logger()
+    case.call = lambda i: lgr.debug("request {} handled", i)
+
+
+def style_case(style: LogStyle) -> Callable[[Case], None]:
+    def setup(case: Case) -> None:
+        case.add(LastLine(), style)
+        lgr = case.logger()
+        case.call = lambda i: lgr.info("request {} handled", i)
+
+    return setup
+
+
+def destination_case(*args: Any, **kwargs: Any) -> Callable[[Case], None]:
+    def setup(case: Case) -> None:
+        case.add(*args, **kwargs)
+        lgr = case.logger()
+        case.call = lambda i: lgr.info("request {} handled", i)
+
+    return setup
+
+
+def case_fanout(case: Case) -> None:
+    case.add("stdout", basic_styles.stdout)
+    case.add("fanout.log", basic_styles.file)
+    case.add("fanout.jsonl", destination_type="jsonl")
+    case.add(LastLine())
+    lgr = case.logger()
+    case.call = lambda i: lgr.info("request {} handled", i)
+
+
+def sticky_case(update_only: bool) -> Callable[[Case], None]:
+    def setup(case: Case) -> None:
+        console = case.add("stdout", basic_styles.stdout)
+        progress = StickyString(["progress: ", "0"], [{}, {"width": 0.5}])
+        console.add_sticky_string(StickyString(["status: running"]))
+        console.add_sticky_string(progress)
+        lgr = case.logger()
+
+        def call(i: int) -> None:
+            progress.update_str(1, str(i))
+            if update_only:
+                console.update_sticky()
+            else:
+                lgr.info("request {} handled", i)
+
+        case.call = call
+
+    return setup
+
+
+def long_message_case(*args: Any, **kwargs: Any) -> Callable[[Case], None]:
+    def setup(case: Case) -> None:
+        case.add(*args, **kwargs)
+        lgr = case.logger()
+        case.call = lambda i: lgr.info(LONG_MESSAGE)
+
+    return setup
+
+
+CASES: dict[str, Callable[[Case], None]] = {
+    "filtered_out": case_filtered,
+    **{f"style/{name}": style_case(style) for name, style in STYLES.items()},
+    "destination/stdout": destination_case("stdout", basic_styles.stdout),
+    "destination/file": destination_case("app.log", basic_styles.file),
+    "destination/jsonl": destination_case("app.jsonl", destination_type="jsonl"),
+    "destination/binary": destination_case("app.bin", destination_type="binary"),
+    "destination/ring": destination_case(
+        "app.ring", basic_styles.file, destination_type="ring", ring_size=1 << 20
+    ),
+    "destination/function": destination_case(LastLine(), basic_styles.file),
+    "destination/function_records": destination_case(LastLine()),
+    "fanout/4": case_fanout,
+    "sticky/log": sticky_case(update_only=False),
+    "sticky/update": sticky_case(update_only=True),
+    "long_message/stdout": long_message_case("stdout", basic_styles.stdout),
+    "long_message/file": long_message_case("long.log", basic_styles.file),
+}
+
+
+def measure(setup: Callable[[Case], None], calls: int) -> dict[str, float]:
+    with tempfile.TemporaryDirectory() as tmp:
+        case = Case(tmp)
+        setup(case)
+        call = case.call
+        for i in range(min(calls, 1000)):
+            call(i)
+        best = float("inf")
+        for _ in range(REPEATS):
+            t0 = time.perf_counter_ns()
+            for i in range(calls):
+                call(i)
+            best = min(best, (time.perf_counter_ns() - t0) / calls)
+        peak = kept = 0
+        tracemalloc.start()
+        for i in range(TRACED_CALLS):
+            tracemalloc.reset_peak()
+            before = tracemalloc.get_traced_memory()[0]
+            call(i)
+            current, current_peak = tracemalloc.get_traced_memory()
+            peak += current_peak - before
+            kept += current - before
+        tracemalloc.stop()
+        case.close()
+    return {
+        "ns_per_call": round(best, 1),
+        "peak_bytes_per_call": round(peak / TRACED_CALLS, 1),
+        "kept_bytes_per_call": round(kept / TRACED_CALLS, 1),
+    }
+
+
+def git_revision() -> Optional[str]:
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            capture_output=True,
+            text=True,
+            check=True,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[0])
+    parser.add_argument("-k", dest="patterns", action="append", default=[])
+    parser.add_argument("-n", "--calls", type=int, default=CALLS)
+    parser.add_argument("--json", help="save the results to this file")
+    parser.add_argument("--compare", help="results of an earlier run to compare to")
+    opts = parser.parse_args()
+
+    baseline = {}
+    if opts.compare:
+        with open(opts.compare, encoding="utf-8") as f:
+            baseline = json.load(f)["results"]
+    out = sys.stdout
+    print(f"{'case':<32}{'ns/call':>12}{'peak B':>10}{'kept B':>10}", file=out)
+    results = {}
+    with open(os.devnull, "w") as devnull:
+        for name, setup in CASES.items():
+            if opts.patterns and not any(p in name for p in opts.patterns):
+                continue
+            sys.stdout = devnull
+            try:
+                res = results[name] = measure(setup, opts.calls)
+            finally:
+                sys.stdout = out
+            line = (
+                f"{name:<32}{res['ns_per_call']:>12.0f}"
+                f"{res['peak_bytes_per_call']:>10.0f}"
+                f"{res['kept_bytes_per_call']:>10.0f}"
+            )
+            if name in baseline:
+                ratio = res["ns_per_call"] / baseline[name]["ns_per_call"]
+                line += f"{ratio - 1:>+10.1%}"
+            print(line, file=out)
+    if opts.json:
+        with open(opts.json, "w", encoding="utf-8") as f:
+            json.dump(
+                {
+                    "revision": git_revision(),
+                    "python": platform.python_version(),
+                    "platform": platform.platform(),
+                    "calls": opts.calls,
+                    "results": results,
+                },
+                f,
+                indent=2,
+            )
+
+
+if __name__ == "__main__":
+    main()
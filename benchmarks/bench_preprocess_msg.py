@@ -0,0 +1,124 @@
+"""Compares basic_styles.preprocess_msg with the original character loop.
+
+Run from the repository root:
+
+    python -m benchmarks.bench_preprocess_msg
+"""
+
+from yapl.styling.basic_styles import preprocess_msg, PREPROCESS_MSG_MAX_LENGTH
+import timeit
+
+
+def legacy_preprocess_msg(msg: str) -> str:
+    is_in_quote = False
+    is_in_brackets = False
+    is_between_spaces = False
+    st_idx = -1
+    l_w = 0
+    ret_str = ""
+    for i, s in enumerate(msg + "\0"):
+        if s == ")" and is_in_brackets:
+            is_in_brackets = False
+            ret_str += (
+                msg[l_w:st_idx] + "\x1b[38;5;8m" + msg[st_idx : i + 1] + "\x1b[0m"
+            )
+            l_w = i + 1
+            st_idx = -1
+            continue
+        if s == "'" and is_in_quote:
+            is_in_quote = False
+            ret_str += (
+                msg[l_w:st_idx] + "\x1b[38;5;2m" + msg[st_idx : i + 1] + "\x1b[0m"
+            )
+            l_w = i + 1
+            st_idx = -1
+            continue
+        if is_in_brackets or is_in_quote:
+            continue
+        if s == "(":
+            is_in_brackets = True
+            is_between_spaces = False
+            st_idx = i
+            continue
+        if s == "'":
+            if i != 0 and msg[i - 1].isalpha():
+                continue
+            is_in_quote = True
+            is_between_spaces = False
+            st_idx = i
+            continue
+        if s == " " and not is_between_spaces:
+            is_between_spaces = True
+            continue
+        if (
+            (s.isupper() or (s.isdigit() or s == "-"))
+            and is_between_spaces
+            and st_idx == -1
+        ):
+            st_idx = i
+            continue
+        if (
+            not (
+                s.isupper()
+                or (s.isdigit() or s == "-" or (s == "." and msg[st_idx].isdigit()))
+            )
+            and not s.isalpha()
+            and st_idx != -1
+        ):
+            if msg[i - 1] == "-":
+                continue
+            ret_str += (
+                msg[l_w:st_idx]
+                + (
+                    "\x1b[38;5;6m"
+                    if (msg[st_idx].isdigit() or msg[st_idx] == "-")
+                    else "\x1b[38;5;5m"
+                )
+                + msg[st_idx : i + s.isdigit()]
+                + "\x1b[0m"
+                + ("" if s.isdigit() else s)
+            )
+            l_w = i + 1
+            st_idx = -1
+            if s != " ":
+                is_between_spaces = False
+        if not (s.isupper() or (s.isdigit() or s == ".")) and s != " ":
+            is_between_spaces = False
+            st_idx = -1
+    ret_str += msg[l_w:]
+    return ret_str
+
+
+SENTENCE = "Connected to HOST-1 at 10.0.0.1 port 8080 (retry 3) as user 'admin' OK"
+MESSAGES = {
+    "short": "request done",
+    "sentence": SENTENCE,
+    "payload_4k": (
+        "payload: " + "{'id': 12, 'name': 'item', 'tags': (a, b), 'ok': True} " * 70
+    )[:4096],
+    "traceback": (
+        'File "/srv/app/handlers.py", line 120, in handle_request\n'
+        "    result = process(payload)\n"
+        "ValueError: invalid literal for int() with base 10: 'abc'\n"
+    )
+    * 20,
+    "over_cap": "x " * (PREPROCESS_MSG_MAX_LENGTH // 2 + 1),
+}
+
+
+def main() -> None:
+    print(f"{'message':<12}{'chars':>8}{'legacy us':>12}{'new us':>10}{'speedup':>9}")
+    for name, msg in MESSAGES.items():
+        if len(msg) <= PREPROCESS_MSG_MAX_LENGTH:
+            assert preprocess_msg(msg) == legacy_preprocess_msg(msg), name
+        number = max(10, 200_000 // (len(msg) + 1))
+        legacy = timeit.timeit(lambda: legacy_preprocess_msg(msg), number=number)
+        new = timeit.timeit(lambda: preprocess_msg(msg), number=number)
+        print(
+            f"{name:<12}{len(msg):>8}{legacy / number * 1e6:>12.2f}"
+            f"{new / number * 1e6:>10.2f}{legacy / new:>8.1f}x"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,98 @@
+"""Times sticky redraws with 1-4 changed rows and checks the screen they draw.
+
+Every frame is written to a buffer and replayed through a minimal terminal
+(cursor up/down, column, erase line); malformed escape sequences fail the
+run, and the sticky block on the replayed screen must match the sticky
+strings afterwards.
+
+Run from the repository root:
+
+    python -m benchmarks.bench_sticky
+"""
+
+from yapl.logger import LoggerContainer
+from yapl.sticky.strs import StickyString
+from yapl.styling.stylingABC import LogStyle
+import random
+import time
+import sys
+import io
+import re
+
+FRAMES = 5_000
+ROWS = 4
+WIDTH = 40
+STYLE = LogStyle("{message}", {"message": "{message}"}, {})
+_TOKENS = re.compile(r"\x1b\[([^A-Za-z]*)([A-Za-z])|(\n)|(\r)|([^\x1b\n\r]+)")
+
+
+def replay(output: str) -> tuple[list[str], int]:
+    # returns the screen lines and the cursor row
+    lines: dict[int, str] = {}
+    y = x = 0
+    for param, command, newline, cr, text in _TOKENS.findall(output):
+        if command:
+            assert param.isdigit() or param == "", f"malformed CSI {param!r}{command}"
+            n = int(param or 1)
+            if command == "A":
+                y -= n
+            elif command == "B":
+                y += n
+            elif command == "G":
+                x = n - 1
+            elif command == "K":
+                lines[y] = ""
+            else:
+                assert command == "m", f"unexpected CSI command {command!r}"
+            assert y >= 0, "cursor moved above the screen"
+        elif newline:
+            y, x = y + 1, 0
+        elif cr:
+            x = 0
+        else:
+            line = lines.get(y, "").ljust(x)
+            lines[y] = line[:x] + text + line[x + len(text) :]
+            x += len(text)
+    return [lines.get(i, "").rstrip() for i in range(max(lines) + 1)], y
+
+
+def run(changed: int) -> float:
+    out = io.StringIO()
+    real_stdout, sys.stdout = sys.stdout, out
+    try:
+        container = LoggerContainer()
+        container.add_log_destination("stdout", STYLE)
+        console = container["stdout"]
+        console.terminal_width.fallback = WIDTH
+        rows = [StickyString([f"row {i}: ", "0"]) for i in range(ROWS)]
+        for row in rows:
+            console.add_sticky_string(row)
+        lgr = container()
+        lgr.info("start")
+        rng = random.Random(changed)
+        t0 = time.perf_counter()
+        for frame in range(FRAMES):
+            for row in rng.sample(rows, changed):
+                row.update_str(1, str(rng.randrange(1000)))
+            console.update_sticky()
+            if frame % 500 == 0:
+                lgr.info(f"frame {frame}")
+        elapsed = time.perf_counter() - t0
+        console.close()
+    finally:
+        sys.stdout = real_stdout
+    screen, y = replay(out.getvalue())
+    expected = [row.render(WIDTH).rstrip() for row in rows]
+    assert screen[y - ROWS : y] == expected, (screen[y - ROWS : y], expected)
+    assert screen[: y - ROWS][-1] == f"frame {(FRAMES - 1) // 500 * 500}", screen
+    return FRAMES / elapsed
+
+
+def main() -> None:
+    print(f"{'changed rows':>14}{'frames/s':>12}")
+    for changed in range(1, ROWS + 1):
+        print(f"{changed:>14}{run(changed):>12.0f}")
+
+
+if __name__ == "__main__":
+    main()
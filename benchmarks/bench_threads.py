@@ -0,0 +1,67 @@
+"""Logs from 1-16 threads into a thread-safe FileLogger and checks every line.
+
+Run from the repository root:
+
+    python -m benchmarks.bench_threads
+"""
+
+from yapl.logger import FileLogger
+from yapl.styling import basic_styles
+from yapl.styling.stylingABC import LogStyle
+import tempfile
+import threading
+import time
+import os
+
+RECORDS = 40_000
+THREAD_COUNTS = (1, 2, 4, 8, 16)
+STYLE = LogStyle(
+    "{event}{message}",
+    {"event": "[{event_type}]:", "message": "{message}"},
+    {},
+)
+
+
+def run(threads: int, path: str) -> float:
+    lgr = FileLogger(path, STYLE, basic_styles.STANDART_EVENT_TYPES)
+    lgr.thread_safe = True
+    per_thread = RECORDS // threads
+    start = threading.Barrier(threads + 1)
+
+    def work(idx: int) -> None:
+        start.wait()
+        for i in range(per_thread):
+            lgr.info(f"thread {idx:02} record {i:06} " + "x" * (i % 64))
+
+    pool = [threading.Thread(target=work, args=(idx,)) for idx in range(threads)]
+    for thread in pool:
+        thread.start()
+    start.wait()
+    t0 = time.perf_counter()
+    for thread in pool:
+        thread.join()
+    lgr.close()
+    elapsed = time.perf_counter() - t0
+
+    seen = [0] * threads
+    with open(path, encoding="utf-8") as f:
+        for line in f:
+            _, thread_s, idx_s, record_s, i_s, *tail = line.rstrip("\n").split(" ")
+            idx, i = int(idx_s), int(i_s)
+            assert thread_s == "thread" and record_s == "record", line
+            assert i == seen[idx] and tail in ([], ["x" * (i % 64)]), line
+            seen[idx] += 1
+    assert seen == [per_thread] * threads, seen
+    return per_thread * threads / elapsed
+
+
+def main() -> None:
+    print(f"{'threads':>8}{'records/s':>12}")
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "threads.log")
+        for threads in THREAD_COUNTS:
+            print(f"{threads:>8}{run(threads, path):>12.0f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -16,4 +16,5 @@ setup(
     author_email="serg46b@gmail.com",
     packages=["yapl", "yapl.sticky", "yapl.styling"],
     install_requires=requirements,
+    extras_require={"orjson": ["orjson"]},
 )
@@ -0,0 +1,78 @@
+from typing import Any, Awaitable, Callable, Optional
+import traceback
+import asyncio
+import inspect
+
+
+def is_async_callable(func: Any) -> bool:
+    return inspect.iscoroutinefunction(func) or inspect.iscoroutinefunction(
+        getattr(func, "__call__", None)
+    )
+
+
+class AsyncCallback:
+    """Runs an ``async def`` log destination on an event loop, from any thread.
+
+    Calling it queues the arguments and returns at once; a writer task on
+    ``loop`` awaits the destination for them one after another, so records
+    arrive in the order they were logged. ``drain()`` waits until everything
+    queued so far was handled. Without a ``loop`` the loop running when the
+    callback is created (or first called) is used.
+    """
+
+    __func: Callable[..., Awaitable[Any]]
+    __queue: Optional[asyncio.Queue] = None
+    __writer: Optional[asyncio.Task] = None
+    loop: Optional[asyncio.AbstractEventLoop]
+
+    def __init__(
+        self,
+        func: Callable[..., Awaitable[Any]],
+        loop: Optional[asyncio.AbstractEventLoop] = None,
+    ) -> None:
+        self.__func = func
+        if loop is None:
+            try:
+                loop = asyncio.get_running_loop()
+            except RuntimeError:
+                pass
+        self.loop = loop
+
+    def __call__(self, *args: Any) -> None:
+        try:
+            running = asyncio.get_running_loop()
+        except RuntimeError:
+            running = None
+        if self.loop is None:
+            if running is None:
+                raise RuntimeError(
+                    f"no event loop to run async log destination {self.__func!r} on"
+                )
+            self.loop = running
+        if running is self.loop:
+            self.__put(args)
+        else:
+            self.loop.call_soon_threadsafe(self.__put, args)
+
+    def __put(self, args: tuple) -> None:
+        if self.__writer is None or self.__writer.done():
+            # a new loop (or the first call) gets its own queue and writer
+            self.__queue = asyncio.Queue()
+            self.__writer = asyncio.get_running_loop().create_task(
+                self.__write(self.__queue)
+            )
+        self.__queue.put_nowait(args)
+
+    async def __write(self, queue: asyncio.Queue) -> None:
+        while True:
+            args = await queue.get()
+            try:
+                await self.__func(*args)
+            except Exception:
+                traceback.print_exc()
+            finally:
+                queue.task_done()
+
+    async def drain(self) -> None:
+        if self.__writer is not None and not self.__writer.done():
+            await self.__queue.join()
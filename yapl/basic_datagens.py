@@ -1,29 +1,159 @@
-from datetime import datetime
-import inspect
+from types import CodeType
+from typing import Literal, Optional
+import time
+import sys
+import os
+
+PACKAGE_DIR = os.path.normcase(os.path.dirname(os.path.abspath(__file__))) + os.sep
 
 
 class GetCallerLocationClass:
-    folder_depth: int = 0
+    __folder_depth: int
+    __code_cache: dict[CodeType, Optional[str]]
+    include_function: bool
+    include_lineno: bool
+
+    def __init__(
+        self,
+        folder_depth: int = 0,
+        include_function: bool = False,
+        include_lineno: bool = False,
+    ) -> None:
+        self.__folder_depth = folder_depth
+        self.__code_cache = {}
+        self.include_function = include_function
+        self.include_lineno = include_lineno
+
+    @property
+    def folder_depth(self) -> int:
+        return self.__folder_depth
+
+    @folder_depth.setter
+    def folder_depth(self, new_depth: int) -> None:
+        self.__folder_depth = new_depth
+        self.__code_cache.clear()
+
+    @property
+    def fields(self) -> frozenset[str]:
+        fields = {"location"}
+        if self.include_function:
+            fields.add("function")
+        if self.include_lineno:
+            fields.add("lineno")
+        return frozenset(fields)
 
-    def __call__(self) -> str:
-        caller_frame = inspect.stack()[4]
-        f_name = caller_frame.filename.replace("\\", "/")
+    def __normalize_filename(self, filename: str) -> Optional[str]:
+        if os.path.normcase(os.path.abspath(filename)).startswith(PACKAGE_DIR):
+            return None
+        f_name = filename.replace("\\", "/")
         f_name_parts = f_name.split("/")
-        if self.folder_depth > len(f_name_parts):
+        if self.__folder_depth > len(f_name_parts):
             return f_name
-        return "/".join(f_name_parts[self.folder_depth :])
+        return "/".join(f_name_parts[self.__folder_depth :])
+
+    def __call__(self) -> str | dict:
+        code_cache = self.__code_cache
+        frame = sys._getframe(1)
+        while frame is not None:
+            code = frame.f_code
+            try:
+                f_name = code_cache[code]
+            except KeyError:
+                f_name = code_cache[code] = self.__normalize_filename(code.co_filename)
+            if f_name is not None:
+                break
+            frame = frame.f_back
+        else:
+            return ""
+        if not (self.include_function or self.include_lineno):
+            return f_name
+        location = {"location": f_name}
+        if self.include_function:
+            location["function"] = code.co_qualname
+        if self.include_lineno:
+            location["lineno"] = frame.f_lineno
+        return location
 
 
 get_caller_location = GetCallerLocationClass()
 
 
-def get_date_and_time() -> dict:
-    date_and_time = {}
-    date_and_time["year"] = datetime.now().year
-    date_and_time["month"] = datetime.now().month
-    date_and_time["day"] = datetime.now().day
-    date_and_time["hour"] = datetime.now().hour
-    date_and_time["minute"] = datetime.now().minute
-    date_and_time["second"] = datetime.now().second
-    date_and_time["microsecond"] = datetime.now().microsecond
-    return date_and_time
+_DATE_AND_TIME_PARTS = frozenset(
+    ("year", "month", "day", "hour", "minute", "second", "date_time", "microsecond")
+)
+
+
+class GetDateAndTimeClass:
+    """Timestamp datagen that reads the clock once per record.
+
+    Everything down to the second is formatted once per second and cached,
+    only the sub-second part is computed per record. ``output`` selects the
+    produced fields: ``"parts"`` gives year..microsecond plus a preformatted
+    ``date_time`` ("YYYY-MM-DD HH:MM:SS"), ``"iso"`` gives an ISO-8601
+    ``timestamp`` with the local UTC offset and ``"epoch"`` gives the raw
+    clock value as ``timestamp``. With ``use_ns`` the clock is read with
+    ``time.time_ns()`` (iso timestamps then carry nanoseconds and epoch
+    timestamps are integer nanoseconds).
+    """
+
+    output: Literal["parts", "iso", "epoch"]
+    use_ns: bool
+    __cache: tuple[int, dict[str, int | str], str, str] = (-1, {}, "", "")
+
+    def __init__(
+        self, output: Literal["parts", "iso", "epoch"] = "parts", use_ns: bool = False
+    ) -> None:
+        self.output = output
+        self.use_ns = use_ns
+
+    @property
+    def fields(self) -> frozenset[str]:
+        if self.output == "parts":
+            return _DATE_AND_TIME_PARTS
+        return frozenset(("timestamp",))
+
+    def __cache_second(
+        self, second: int
+    ) -> tuple[int, dict[str, int | str], str, str]:
+        tm = time.localtime(second)
+        date_time = f"{tm.tm_year}-{tm.tm_mon:02d}-{tm.tm_mday:02d} {tm.tm_hour:02d}:{tm.tm_min:02d}:{tm.tm_sec:02d}"
+        offset = tm.tm_gmtoff // 60
+        sign = "+" if offset >= 0 else "-"
+        iso_prefix = date_time.replace(" ", "T")
+        iso_suffix = f"{sign}{abs(offset) // 60:02d}:{abs(offset) % 60:02d}"
+        parts = {
+            "year": tm.tm_year,
+            "month": tm.tm_mon,
+            "day": tm.tm_mday,
+            "hour": tm.tm_hour,
+            "minute": tm.tm_min,
+            "second": tm.tm_sec,
+            "date_time": date_time,
+        }
+        self.__cache = (second, parts, iso_prefix, iso_suffix)
+        return self.__cache
+
+    def __call__(self) -> dict:
+        if self.use_ns:
+            now = time.time_ns()
+            second, sub_second = divmod(now, 1_000_000_000)
+            microsecond = sub_second // 1000
+        else:
+            now = time.time()
+            second = int(now)
+            microsecond = int((now - second) * 1_000_000)
+        if self.output == "epoch":
+            return {"timestamp": now}
+        cache = self.__cache
+        if cache[0] != second:
+            cache = self.__cache_second(second)
+        if self.output == "iso":
+            if self.use_ns:
+                return {"timestamp": f"{cache[2]}.{sub_second:09d}{cache[3]}"}
+            return {"timestamp": f"{cache[2]}.{microsecond:06d}{cache[3]}"}
+        date_and_time = cache[1].copy()
+        date_and_time["microsecond"] = microsecond
+        return date_and_time
+
+
+get_date_and_time = GetDateAndTimeClass()
@@ -0,0 +1,66 @@
+from typing import Any, Callable, Mapping, Optional
+from multiprocessing.context import BaseContext
+import multiprocessing
+import threading
+import traceback
+import atexit
+import os
+
+
+class LogHub:
+    """Receives batches of records sent by other processes and dispatches them.
+
+    Child processes put lists of plain ``dict`` records on ``queue``; a
+    listener thread in the owning process hands every record to ``dispatch``.
+    The queue is a ``SimpleQueue`` so writers need no feeder thread and can be
+    forked at any point. ``stop()`` dispatches what was already sent before
+    the listener exits; it runs at interpreter exit and does nothing in
+    forked children.
+    """
+
+    __dispatch: Callable[[Mapping[str, Any]], None]
+    __thread: threading.Thread
+    __stopped: bool = False
+    __pid: int
+    queue: Any
+
+    def __init__(
+        self,
+        dispatch: Callable[[Mapping[str, Any]], None],
+        ctx: Optional[BaseContext] = None,
+    ) -> None:
+        if ctx is None:
+            ctx = multiprocessing.get_context()
+        self.__dispatch = dispatch
+        self.__pid = os.getpid()
+        self.queue = ctx.SimpleQueue()
+        self.__thread = threading.Thread(
+            target=self.__run, name="yapl-log-hub", daemon=True
+        )
+        self.__thread.start()
+        atexit.register(self.stop)
+
+    @property
+    def running(self) -> bool:
+        return not self.__stopped
+
+    def stop(self) -> None:
+        # forked children inherit the hub, only its owner may stop it
+        if self.__stopped or os.getpid() != self.__pid:
+            return
+        self.__stopped = True
+        atexit.unregister(self.stop)
+        self.queue.put(None)
+        if threading.current_thread() is not self.__thread:
+            self.__thread.join()
+
+    def __run(self) -> None:
+        while True:
+            batch = self.queue.get()
+            if batch is None:
+                return
+            for record in batch:
+                try:
+                    self.__dispatch(record)
+                except Exception:
+                    traceback.print_exc()
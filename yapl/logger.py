@@ -3,23 +3,226 @@ from .errors import LinkToSameDestinationError
 from .styling.stylingABC import LogStyle
 from .styling import basic_styles
 from .sticky.strs import StickyString
-from typing import Callable, Literal, Any, Optional
+from .sticky.terminal import TerminalWidth
+from .workers import LogWorker, OverflowPolicy
+from .sampling import Sampler
+from .stats import DestinationStats
+from typing import TYPE_CHECKING, Callable, Literal, Any, Iterable, Mapping, Optional
 from abc import ABC, abstractmethod
-from io import TextIOWrapper
+from types import MappingProxyType
+from functools import partial
+from collections import deque
+from contextlib import nullcontext, AbstractContextManager
+from typing import BinaryIO
+import threading
+import warnings
+import weakref
+import atexit
+import time
 import sys
 import os
+import io
+import re
+
+# hubs, asyncio, executors, compression and the structured and ring file
+# formats are imported when first used
+if TYPE_CHECKING:
+    from concurrent.futures import ThreadPoolExecutor
+    from multiprocessing.context import BaseContext
+    from .hub import LogHub
+    from .aio import AsyncCallback
+    from .ring import RingFile
+    from .structured import BinaryRecordEncoder, JsonLinesEncoder, StructuredFormat
+    import asyncio
+
+_open_loggers: "weakref.WeakSet[BaseLogger]" = weakref.WeakSet()
+# the loggers an event type goes to and the datagens their records need
+Route = tuple[tuple["BaseLogger", ...], dict[str, Callable[[], Any]]]
+_no_lock = nullcontext()
+
+
+@atexit.register
+def _close_open_loggers() -> None:
+    # queued records are drained and buffered files written out before exit
+    for lgr in list(_open_loggers):
+        lgr.close()
+
+
+def format_message(msg: str | Callable[[], str], args: tuple, kwargs: dict) -> str:
+    if args or kwargs:
+        return msg.format(*args, **kwargs)  # type: ignore[union-attr]
+    if callable(msg):
+        return msg()
+    return msg
+
+
+def event_method_name(evt_type: str) -> Optional[str]:
+    name = evt_type.lower().replace(" ", "_")
+    if name.startswith("_") or name.upper().replace("_", " ") != evt_type:
+        return None
+    return name
+
+
+def _logger_event_method(
+    lgr_ref: "weakref.ReferenceType[BaseLogger]", evt_type: str
+) -> Callable[..., None]:
+    # holds the logger weakly, so caching the method on it creates no cycle
+    def lg(
+        msg: str | Callable[[], str],
+        *args: Any,
+        verbosity_level: Optional[int] = None,
+        **kwargs: Any,
+    ):
+        lgr_ref().log_message(  # type: ignore[union-attr]
+            evt_type, msg, *args, verbosity_level=verbosity_level, **kwargs
+        )
+
+    return lg
+
+
+def select_datagens(
+    optional_datagens: dict[str, Callable[[], Any]],
+    fields: Optional[frozenset[str] | set[str]],
+) -> dict[str, Callable[[], Any]]:
+    # keeps the datagens producing any of `fields` (None: every field is
+    # needed) and the ones that do not declare their fields; a datagen that
+    # returns a plain value produces the field named after its key
+    if fields is None:
+        return optional_datagens
+    selected = {}
+    for key, datagen in optional_datagens.items():
+        produced = getattr(datagen, "fields", None)
+        if produced is None or key in fields or not fields.isdisjoint(produced):
+            selected[key] = datagen
+    return selected
+
+
+def build_route(
+    loggers: "Iterable[BaseLogger]",
+    evt_type: str,
+    optional_datagens: dict[str, Callable[[], Any]],
+) -> Route:
+    enabled = tuple(lgr for lgr in loggers if lgr.is_enabled(evt_type))
+    fields: set[str] = set()
+    for lgr in enabled:
+        required_fields = lgr.required_fields
+        if required_fields is None:
+            return enabled, optional_datagens
+        fields.update(required_fields)
+    return enabled, select_datagens(optional_datagens, fields)
+
+
+def cached_route(
+    routes: dict[str, Route],
+    loggers: "Iterable[BaseLogger]",
+    evt_type: str,
+    optional_datagens: dict[str, Callable[[], Any]],
+) -> Route:
+    # `routes` is shared by a container and its loggers, and cleared whenever
+    # a destination, its levels or the datagens change
+    try:
+        return routes[evt_type]
+    except KeyError:
+        route = routes[evt_type] = build_route(loggers, evt_type, optional_datagens)
+        return route
+
+
+def build_log_record(
+    evt_type: str, msg: str, optional_datagens: dict[str, Callable[[], Any]]
+) -> Mapping[str, Any]:
+    log_obj = {"event_type": evt_type, "message": msg}
+    for key in optional_datagens:
+        val = optional_datagens[key]()
+        if type(val) == dict:
+            log_obj.update(val)
+            continue
+        log_obj[key] = val
+    return MappingProxyType(log_obj)
+
+
+def log_suppressed(route: Route, evt_type: str, suppressed: int) -> None:
+    loggers, datagens = route
+    record = build_log_record(
+        evt_type, f"suppressed {suppressed} similar messages", datagens
+    )
+    for lgr in loggers:
+        lgr.log_json(record)
+
+
+_ROTATED_SUFFIX = re.compile(r"\.(\d{8}-\d{6})(?:\.(\d+))?(?:\.gz)?")
+
+
+def _rotated_file_name(path: str) -> str:
+    # the counter continues after the highest one used in this second, a
+    # lower one freed by pruning would make the new segment sort as oldest
+    stamp = time.strftime("%Y%m%d-%H%M%S")
+    folder, name = os.path.split(os.path.abspath(path))
+    last = -1
+    for entry in os.scandir(folder):
+        if not entry.name.startswith(name):
+            continue
+        suffix = _ROTATED_SUFFIX.fullmatch(entry.name[len(name) :])
+        if suffix is not None and suffix[1] == stamp:
+            last = max(last, int(suffix[2] or 0))
+    if last < 0:
+        return f"{path}.{stamp}"
+    return f"{path}.{stamp}.{last + 1}"
+
+
+def _finish_rotation(
+    path: str, rotated: str, compress: bool, backup_count: Optional[int]
+) -> None:
+    if compress:
+        import shutil
+        import gzip
+
+        with open(rotated, "rb") as src, gzip.open(rotated + ".gz", "wb") as dst:
+            shutil.copyfileobj(src, dst)
+        os.remove(rotated)
+    if backup_count is None:
+        return
+    folder, name = os.path.split(os.path.abspath(path))
+    backups = []
+    for entry in os.scandir(folder):
+        if not entry.name.startswith(name):
+            continue
+        suffix = _ROTATED_SUFFIX.fullmatch(entry.name[len(name) :])
+        if suffix is not None:
+            backups.append((suffix[1], int(suffix[2] or 0), entry.path))
+    backups.sort()
+    for _, _, backup in backups[: max(len(backups) - backup_count, 0)]:
+        os.remove(backup)
 
 
 class BaseLogger(ABC):
+    """Base class of the log destinations.
+
+    Loggers are not synchronized by default. Setting ``thread_safe`` gives
+    the logger its own lock: records are still formatted in the calling
+    thread, only writing them out (``log_raw``) and ``flush()`` happen under
+    the lock, so lines written from several threads never interleave and
+    loggers for different destinations never wait for each other.
+    """
+
     __log_destination: Literal["stdout"] | str | None
     __optional_data_gens: dict[str, Callable[[], Any]]
-    event_types: list[str] | Literal["any"]
-    verbosity_levels: dict[str, int]
-    verbosity: int
-    logging_callback: Optional[Callable[..., Any]]
-    style: LogStyle
+    __event_types: list[str] | Literal["any"]
+    __verbosity_levels: dict[str, int]
+    __verbosity: int
+    __enabled_events: dict[str, bool]
+    __event_methods: list[str]
+    __logging_callback: Optional[Callable[..., Any]] = None
+    __style: LogStyle
+    __selected_datagens: Optional[dict[str, Callable[[], Any]]] = None
     initial_callback: Optional[Callable[..., Any]]
-    destruction_callback: Optional[Callable[..., Any]]
+    destruction_callback: Optional[Callable[..., Any]] = None
+    levels_callback: Optional[Callable[[], Any]] = None
+    worker: Optional[LogWorker] = None
+    stats: Optional[DestinationStats] = None
+    __closed: bool = True
+    __write_lock: Optional[threading.RLock] = None
+    __held_records: Optional[deque[Mapping[str, Any]]] = None
+    dump_events: tuple[str, ...] = ("ERROR", "CRITICAL")
 
     def __init__(
         self,
@@ -33,81 +236,341 @@ class BaseLogger(ABC):
         destruction_callback: Optional[Callable[..., Any]] = None,
     ) -> None:
         self.__log_destination = log_destination
+        self.__event_methods = []
         self.__optional_data_gens = {}
-        self.event_types = event_list
-        self.verbosity_levels = {} if verbosity_levels is None else verbosity_levels
-        self.verbosity = len(event_list) if verbosity is None else verbosity
+        self.__event_types = event_list
+        self.__cache_event_methods()
+        self.__verbosity_levels = {} if verbosity_levels is None else verbosity_levels
+        self.__verbosity = len(event_list) if verbosity is None else verbosity
+        self.__rebuild_enabled_events()
         self.style = style
         self.logging_callback = logging_callback
         self.initial_callback = ininial_callback
         self.destruction_callback = destruction_callback
+        self.__closed = False
+        _open_loggers.add(self)
         if self.style.initial_string:
             self.log_raw(self.style.initial_string)
         if self.initial_callback:
             self.initial_callback(self)
 
     def __del__(self):
-        if self.style.final_string:
-            self.log_raw(self.style.final_string)
+        if not self.__closed:
+            self.close()
         if self.destruction_callback:
             self.destruction_callback()
 
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
     def __getattr__(self, name: str) -> Any:
         norm_name = name.upper().replace("_", " ")
-        if self.event_types != "any" and norm_name not in self.event_types:
+        if (
+            name.startswith("_")
+            or self.event_types != "any"
+            and norm_name not in self.event_types
+        ):
             raise AttributeError(
                 f"'{BaseLogger.__name__}' object has no attribute '{name}'"
             )
-
-        def lg(msg: str, verbosity_level: Optional[int] = None):
-            self.log_message(norm_name, msg, verbosity_level)
-
+        lg = _logger_event_method(weakref.ref(self), norm_name)
+        self.__dict__[name] = lg
+        self.__event_methods.append(name)
         return lg
 
+    def __cache_event_methods(self) -> None:
+        for name in self.__event_methods:
+            self.__dict__.pop(name, None)
+        self.__event_methods = []
+        if type(self.__event_types) != list:
+            return
+        lgr_ref = weakref.ref(self)
+        for evt_type in self.__event_types:
+            name = event_method_name(evt_type)
+            if name is None or hasattr(type(self), name):
+                continue
+            self.__dict__[name] = _logger_event_method(lgr_ref, evt_type)
+            self.__event_methods.append(name)
+
     @property
     def optional_datagens(self) -> dict[str, Callable[[], Any]]:
+        # use update_optional_datagens() to change them
         return self.__optional_data_gens
 
+    def update_optional_datagens(self, name: str, datagen: Callable[[], Any]) -> None:
+        self.__optional_data_gens[name] = datagen
+        self.__fields_changed()
+
+    @property
+    def style(self) -> LogStyle:
+        return self.__style
+
+    @style.setter
+    def style(self, new_style: LogStyle) -> None:
+        self.__style = new_style
+        self.__fields_changed()
+
+    @property
+    def logging_callback(self) -> Optional[Callable[..., Any]]:
+        return self.__logging_callback
+
+    @logging_callback.setter
+    def logging_callback(self, new_callback: Optional[Callable[..., Any]]) -> None:
+        self.__logging_callback = new_callback
+        self.__fields_changed()
+
+    @property
+    def required_fields(self) -> Optional[frozenset[str]]:
+        # record fields this logger reads, None when it needs all of them
+        if self.__logging_callback is not None:
+            return None
+        return self.__style.fields
+
+    def __fields_changed(self) -> None:
+        self.__selected_datagens = None
+        if self.levels_callback:
+            self.levels_callback()
+
     @property
     def log_destination(self) -> str | None:
         return self.__log_destination
 
-    def log_json(self, json: dict) -> None:
-        self.log_raw(self.style.to_format_string(json))
+    @property
+    def closed(self) -> bool:
+        return self.__closed
+
+    @property
+    def thread_safe(self) -> bool:
+        return self.__write_lock is not None
+
+    @thread_safe.setter
+    def thread_safe(self, value: bool) -> None:
+        self.__write_lock = threading.RLock() if value else None
+
+    @property
+    def write_lock(self) -> AbstractContextManager:
+        if self.__write_lock is None:
+            return _no_lock
+        return self.__write_lock
+
+    @property
+    def event_types(self) -> list[str] | Literal["any"]:
+        return self.__event_types
+
+    @event_types.setter
+    def event_types(self, new_event_types: list[str] | Literal["any"]) -> None:
+        self.__event_types = new_event_types
+        self.__cache_event_methods()
+        self.__rebuild_enabled_events()
+
+    @property
+    def verbosity_levels(self) -> dict[str, int]:
+        return self.__verbosity_levels
+
+    @verbosity_levels.setter
+    def verbosity_levels(self, new_verbosity_levels: dict[str, int]) -> None:
+        self.__verbosity_levels = new_verbosity_levels
+        self.__rebuild_enabled_events()
+
+    @property
+    def verbosity(self) -> int:
+        return self.__verbosity
+
+    @verbosity.setter
+    def verbosity(self, new_verbosity: int) -> None:
+        self.__verbosity = new_verbosity
+        self.__rebuild_enabled_events()
+
+    def __rebuild_enabled_events(self) -> None:
+        self.__enabled_events = {}
+        if type(self.__event_types) == list:
+            for evt_type in self.__event_types:
+                self.__enabled_events[evt_type] = self.__verbosity_level(evt_type) <= (
+                    self.__verbosity
+                )
+        if self.levels_callback:
+            self.levels_callback()
+
+    def __verbosity_level(self, evt_type: str) -> int:
+        try:
+            return self.__verbosity_levels[evt_type]
+        except KeyError:
+            if type(self.__event_types) == list:
+                return (
+                    len(self.__event_types) - self.__event_types.index(evt_type) - 1
+                )
+            return 0
+
+    def start_worker(
+        self, max_size: int = 1024, overflow: OverflowPolicy = "block"
+    ) -> LogWorker:
+        if self.worker is None or not self.worker.running:
+            self.worker = LogWorker(
+                self.emit, max_size, overflow, f"yapl-{type(self).__name__}"
+            )
+        return self.worker
+
+    def hold_records(
+        self,
+        max_records: Optional[int] = 1024,
+        dump_events: tuple[str, ...] = ("ERROR", "CRITICAL"),
+    ) -> None:
+        # keeps the last `max_records` records in memory and writes them out
+        # only when a record of `dump_events` arrives, None stops holding
+        if max_records is None:
+            self.__held_records = None
+            return
+        self.__held_records = deque(self.__held_records or (), max_records)
+        self.dump_events = dump_events
+
+    def dump_held_records(self) -> None:
+        held = self.__held_records
+        if held is None:
+            return
+        while True:
+            try:
+                json = held.popleft()
+            except IndexError:
+                return
+            if self.worker is not None:
+                self.worker.put(json)
+            else:
+                self.emit(json)
+
+    def log_json(self, json: Mapping[str, Any]) -> None:
+        if self.__held_records is not None:
+            self.__held_records.append(json)
+            if json["event_type"] in self.dump_events:
+                self.dump_held_records()
+            return
+        if self.worker is not None:
+            self.worker.put(json)
+            return
+        self.emit(json)
+
+    def emit(self, json: Mapping[str, Any]) -> None:
+        if self.stats is not None:
+            self.__emit_measured(json, self.stats)
+            return
+        raw_msg = self.style.to_format_string(json)
+        if self.__write_lock is None:
+            self.log_raw(raw_msg)
+        else:
+            with self.__write_lock:
+                self.log_raw(raw_msg)
+        if self.logging_callback:
+            # callbacks get their own plain dict, the record itself is shared
+            self.logging_callback(dict(json))
+
+    def __emit_measured(self, json: Mapping[str, Any], stats: DestinationStats) -> None:
+        t0 = time.perf_counter_ns()
+        raw_msg = self.style.to_format_string(json)
+        t1 = time.perf_counter_ns()
+        with self.write_lock:
+            self.log_raw(raw_msg)
+        stats.log_raw.add(time.perf_counter_ns() - t1)
+        stats.formatting.add(t1 - t0)
+        stats.emitted += 1
         if self.logging_callback:
-            self.logging_callback(json)
+            self.logging_callback(dict(json))
+
+    def is_enabled(self, evt_type: str, verbosity_level: Optional[int] = None) -> bool:
+        if verbosity_level:
+            return verbosity_level <= self.__verbosity
+        try:
+            return self.__enabled_events[evt_type]
+        except KeyError:
+            try:
+                enabled = self.__verbosity_level(evt_type) <= self.__verbosity
+            except ValueError:
+                # not one of this logger's event types
+                enabled = False
+            self.__enabled_events[evt_type] = enabled
+            return enabled
 
     def log_message(
-        self, evt_type: str, msg: str, verbosity_level: Optional[int] = None
+        self,
+        evt_type: str,
+        msg: str | Callable[[], str],
+        *args: Any,
+        verbosity_level: Optional[int] = None,
+        **kwargs: Any,
     ) -> None:
-        v_l = verbosity_level
-        if not v_l:
-            try:
-                v_l = self.verbosity_levels[evt_type]
-            except:
-                v_l = 0
-                if type(self.event_types) == list:
-                    v_l = len(self.event_types) - self.event_types.index(evt_type) - 1
-        if v_l > self.verbosity:
+        if (
+            len(args) == 1
+            and type(args[0]) == int
+            and verbosity_level is None
+            and not kwargs
+            and type(msg) == str
+            and "{" not in msg
+        ):
+            # `debug("msg", 1)`: verbosity_level used to be the second argument
+            warnings.warn(
+                "passing verbosity_level positionally is deprecated, "
+                "use verbosity_level=...",
+                DeprecationWarning,
+                stacklevel=3,
+            )
+            verbosity_level, args = args[0], ()
+        if not self.is_enabled(evt_type, verbosity_level):
             return
-        log_obj = {"event_type": evt_type, "message": msg}
-        for key in self.__optional_data_gens:
-            val = self.__optional_data_gens[key]()
-            if type(val) == dict:
-                log_obj.update(val)
-                continue
-            log_obj[key] = val
-        self.log_json(log_obj)
+        msg = format_message(msg, args, kwargs)
+        datagens = self.__selected_datagens
+        if datagens is None:
+            datagens = self.__selected_datagens = select_datagens(
+                self.__optional_data_gens, self.required_fields
+            )
+        self.log_json(build_log_record(evt_type, msg, datagens))
+
+    def flush(self) -> None:
+        pass
+
+    def close(self) -> None:
+        if self.__closed:
+            return
+        self.__closed = True
+        _open_loggers.discard(self)
+        if self.worker is not None:
+            self.worker.stop()
+        with self.write_lock:
+            if self.style.final_string:
+                self.log_raw(self.style.final_string)
+            self.flush()
+
+    def discard(self) -> None:
+        # drops the logger without writing anything, used for the loggers a
+        # forked process inherits from its parent
+        self.__closed = True
+        _open_loggers.discard(self)
+        self.worker = None
 
     @abstractmethod
     def log_raw(self, raw_msg: str) -> None: ...
 
 
 class ConsoleLogger(BaseLogger):
+    """Writes to stdout and keeps the sticky strings pinned below the output.
+
+    Every redraw (erasing the sticky block, the pending log lines and the
+    sticky block itself) goes out as a single write. With ``refresh_rate``
+    set, redraws happen at most that many times per second while sticky
+    strings are shown; log lines arriving in between are held back and
+    written above the sticky block with the next frame. Frames without new
+    log lines only rewrite the sticky rows that changed since the last one.
+    """
+
     __log_destination: Literal["stdout"]
     __sticky_strings: list[StickyString]
-    __s_str_is_terminal_dirty: bool = False
-    __s_str_deleted_amount: int = 0
+    __last_rows: list[str]
+    __pending_lines: list[str]
+    __last_frame: float = 0.0
+    __frame_timer: Optional[threading.Timer] = None
+    __frame_lock: threading.RLock
+    refresh_rate: Optional[float]
+    terminal_width: TerminalWidth
 
     def __init__(
         self,
@@ -116,7 +579,14 @@ class ConsoleLogger(BaseLogger):
         logging_callback: Optional[Callable[..., Any]] = None,
         ininial_callback: Callable[..., Any] | None = None,
         destruction_callback: Callable[..., Any] | None = None,
+        refresh_rate: Optional[float] = None,
     ) -> None:
+        self.__sticky_strings = []
+        self.__last_rows = []
+        self.__pending_lines = []
+        self.__frame_lock = threading.RLock()
+        self.refresh_rate = refresh_rate
+        self.terminal_width = TerminalWidth()
         super().__init__(
             "stdout",
             style,
@@ -125,47 +595,155 @@ class ConsoleLogger(BaseLogger):
             ininial_callback=ininial_callback,
             destruction_callback=destruction_callback,
         )
-        self.__sticky_strings = []
 
     def add_sticky_string(self, s_str: StickyString) -> None:
-        self.__sticky_strings.append(s_str)
+        with self.__frame_lock:
+            self.__sticky_strings.append(s_str)
 
     def rem_sticky_strings(self, s_str: StickyString) -> None:
-        try:
-            self.__sticky_strings.remove(s_str)
-            self.__s_str_deleted_amount += 1
-        except ValueError:
-            return
+        with self.__frame_lock:
+            try:
+                self.__sticky_strings.remove(s_str)
+            except ValueError:
+                return
 
     def log_raw(self, raw_msg) -> None:
-        if self.__s_str_is_terminal_dirty:
-            self.__clean_sticky()
-        self.__internal_log_raw(raw_msg + "\n")
-        self.__log_sticky()
+        if self.stats is not None:
+            self.stats.bytes_written += len(raw_msg.encode("utf-8", "replace")) + 1
+        with self.__frame_lock:
+            self.__pending_lines.append(raw_msg)
+            self.__request_frame()
 
     def update_sticky(self) -> None:
-        if self.__s_str_is_terminal_dirty:
-            self.__clean_sticky()
-        self.__log_sticky()
+        with self.__frame_lock:
+            self.__request_frame()
+
+    def __request_frame(self) -> None:
+        if self.refresh_rate is None or not (
+            self.__sticky_strings or self.__last_rows
+        ):
+            self.__draw_frame()
+            return
+        wait = self.__last_frame + 1 / self.refresh_rate - time.monotonic()
+        if wait <= 0:
+            self.__draw_frame()
+            return
+        if self.__frame_timer is None:
+            self.__frame_timer = threading.Timer(wait, self.__draw_delayed_frame)
+            self.__frame_timer.daemon = True
+            self.__frame_timer.start()
+
+    def __draw_delayed_frame(self) -> None:
+        with self.__frame_lock:
+            self.__frame_timer = None
+            self.__draw_frame()
+
+    def __draw_frame(self) -> None:
+        rows = []
+        if self.__sticky_strings:
+            term_width = self.terminal_width.columns
+            rows = [s_str.render(term_width) for s_str in self.__sticky_strings]
+        if self.__pending_lines or len(rows) != len(self.__last_rows):
+            frame = self.__redraw_frame(rows)
+        else:
+            frame = self.__update_rows(rows)
+        self.__last_rows = rows
+        self.__last_frame = time.monotonic()
+        if frame:
+            sys.stdout.write("".join(frame))
+
+    def __redraw_frame(self, rows: list[str]) -> list[str]:
+        frame = ["\x1b[1A\x1b[2K" * len(self.__last_rows)]
+        for line in self.__pending_lines:
+            frame += (line, "\n")
+        self.__pending_lines.clear()
+        for row in rows:
+            frame += (row, "\n")
+        return frame
 
-    def __clean_sticky(self) -> None:
-        for _ in range(len(self.__sticky_strings) + self.__s_str_deleted_amount):
-            self.__s_str_deleted_amount = 0
-            self.__s_str_is_terminal_dirty = False
-            sys.stdout.write("\x1b[1A\x1b[2K")
+    def __update_rows(self, rows: list[str]) -> list[str]:
+        # the cursor stays on the line below the sticky block, only the rows
+        # that differ from the last frame are rewritten in place
+        frame = []
+        rows_up = 0
+        for i, (old_row, row) in enumerate(zip(self.__last_rows, rows)):
+            if row == old_row:
+                continue
+            row_up = len(rows) - i
+            if row_up > rows_up:
+                frame.append(f"\x1b[{row_up - rows_up}A")
+            elif row_up < rows_up:
+                frame.append(f"\x1b[{rows_up - row_up}B")
+            rows_up = row_up
+            frame += self.__row_update(old_row, row)
+        if rows_up:
+            frame.append(f"\x1b[{rows_up}B\r")
+        return frame
 
-    def __log_sticky(self) -> None:
-        for s_str in self.__sticky_strings:
-            self.__s_str_is_terminal_dirty = True
-            sys.stdout.write(s_str.summary_string + "\n")
+    @staticmethod
+    def __row_update(old_row: str, row: str) -> tuple[str, ...]:
+        if (
+            len(old_row) == len(row)
+            and row.isascii()
+            and old_row.isascii()
+            and row.isprintable()
+            and old_row.isprintable()
+        ):
+            first = 0
+            while old_row[first] == row[first]:
+                first += 1
+            last = len(row)
+            while old_row[last - 1] == row[last - 1]:
+                last -= 1
+            return (f"\x1b[{first + 1}G", row[first:last])
+        return ("\r\x1b[2K", row)
 
-    def __internal_log_raw(self, raw_msg) -> None:
-        sys.stdout.write(raw_msg)
+    def flush(self) -> None:
+        with self.__frame_lock:
+            if self.__frame_timer is not None:
+                self.__frame_timer.cancel()
+                self.__frame_timer = None
+                self.__draw_frame()
+        sys.stdout.flush()
 
 
 class FileLogger(BaseLogger):
+    """Writes formatted records to a file through an explicit write buffer.
+
+    The buffer is written out when it holds ``buffer_records`` records or
+    ``buffer_bytes`` encoded bytes, at the latest ``flush_interval_ms`` after
+    a record entered the empty buffer (a timer thread writes it out, so the
+    logger is made ``thread_safe``) and right after a record whose event
+    type is in ``flush_events``. ``None`` disables a criterion. Call
+    ``flush()``/``close()`` or use the logger as a context manager to write out
+    the rest; open loggers are also closed at interpreter exit.
+
+    ``mode="a"`` appends to an existing file instead of truncating it. The
+    file is rotated before a record that would grow it past ``max_bytes`` and
+    ``rotate_interval`` seconds after it was opened: it is renamed to
+    ``<path>.<YYYYmmdd-HHMMSS>`` and a new file is started. Rotated files are
+    gzipped when ``compress`` is set and only the newest ``backup_count`` are
+    kept; both happen on a background thread.
+    """
+
     __log_destination: str
-    __file: TextIOWrapper
+    __file: BinaryIO
+    __file_size: int
+    __opened_at: float
+    __buffer: list[bytes]
+    __buffered_bytes: int
+    __last_flush: float
+    __flush_interval_ms: Optional[float] = None
+    __flush_timer: Optional[threading.Timer] = None
+    __rotation_executor: "Optional[ThreadPoolExecutor]" = None
+    encoding: str
+    buffer_records: Optional[int]
+    buffer_bytes: Optional[int]
+    flush_events: tuple[str, ...]
+    max_bytes: Optional[int]
+    rotate_interval: Optional[float]
+    backup_count: Optional[int]
+    compress: bool
 
     def __init__(
         self,
@@ -175,7 +753,33 @@ class FileLogger(BaseLogger):
         logging_callback: Callable[..., Any] | None = None,
         ininial_callback: Callable[..., Any] | None = None,
         destruction_callback: Callable[..., Any] | None = None,
+        buffer_records: Optional[int] = None,
+        buffer_bytes: Optional[int] = io.DEFAULT_BUFFER_SIZE,
+        flush_interval_ms: Optional[float] = None,
+        flush_events: tuple[str, ...] = ("ERROR", "CRITICAL"),
+        encoding: str = "utf-8",
+        mode: Literal["w", "a"] = "w",
+        max_bytes: Optional[int] = None,
+        rotate_interval: Optional[float] = None,
+        backup_count: Optional[int] = None,
+        compress: bool = False,
     ) -> None:
+        if mode not in ("w", "a"):
+            raise ValueError(f"unknown file mode '{mode}' (expected 'w' or 'a')")
+        self.__log_destination = log_destination
+        self.__open_file("ab" if mode == "a" else "wb")
+        self.__buffer = []
+        self.__buffered_bytes = 0
+        self.__last_flush = time.monotonic()
+        self.encoding = encoding
+        self.buffer_records = buffer_records
+        self.buffer_bytes = buffer_bytes
+        self.flush_interval_ms = flush_interval_ms
+        self.flush_events = flush_events
+        self.max_bytes = max_bytes
+        self.rotate_interval = rotate_interval
+        self.backup_count = backup_count
+        self.compress = compress
         super().__init__(
             log_destination,
             style,
@@ -184,29 +788,296 @@ class FileLogger(BaseLogger):
             ininial_callback=ininial_callback,
             destruction_callback=destruction_callback,
         )
-        self.__file = open(log_destination, "w")
 
-    def __del__(self):
+    @property
+    def flush_interval_ms(self) -> Optional[float]:
+        return self.__flush_interval_ms
+
+    @flush_interval_ms.setter
+    def flush_interval_ms(self, new_interval: Optional[float]) -> None:
+        self.__flush_interval_ms = new_interval
+        if new_interval is not None:
+            # the flush timer writes the buffer out from its own thread
+            self.thread_safe = True
+
+    def __open_file(self, mode: str) -> None:
+        self.__file = open(self.__log_destination, mode)
+        self.__file_size = os.fstat(self.__file.fileno()).st_size
+        self.__opened_at = time.monotonic()
+
+    @property
+    def file_size(self) -> int:
+        return self.__file_size + self.__buffered_bytes
+
+    def emit(self, json: Mapping[str, Any]) -> None:
+        super().emit(json)
+        if json["event_type"] in self.flush_events:
+            self.flush()
+
+    def log_raw(self, raw_msg: str) -> None:
+        self.log_bytes((raw_msg + "\n").encode(self.encoding))
+
+    def log_bytes(self, data: bytes) -> None:
+        if (
+            self.max_bytes is not None
+            and self.__buffered_bytes + len(data) + self.__file_size > self.max_bytes
+            and self.__buffered_bytes + self.__file_size > 0
+        ) or (
+            self.rotate_interval is not None
+            and time.monotonic() - self.__opened_at >= self.rotate_interval
+        ):
+            self.rotate()
+        self.__buffer.append(data)
+        self.__buffered_bytes += len(data)
+        if self.stats is not None:
+            self.stats.bytes_written += len(data)
+        if (
+            (
+                self.buffer_records is not None
+                and len(self.__buffer) >= self.buffer_records
+            )
+            or (
+                self.buffer_bytes is not None
+                and self.__buffered_bytes >= self.buffer_bytes
+            )
+            or (
+                self.__flush_interval_ms is not None
+                and (time.monotonic() - self.__last_flush) * 1000
+                >= self.__flush_interval_ms
+            )
+        ):
+            self.flush()
+        elif self.__flush_interval_ms is not None and self.__flush_timer is None:
+            self.__flush_timer = threading.Timer(
+                self.__flush_interval_ms / 1000, self.flush
+            )
+            self.__flush_timer.daemon = True
+            self.__flush_timer.start()
+
+    def segment_header(self) -> bytes:
+        # written at the start of every file that rotation starts
+        if self.style.initial_string:
+            return (self.style.initial_string + "\n").encode(self.encoding)
+        return b""
+
+    def rotate(self) -> None:
+        with self.write_lock:
+            if self.__file.closed:
+                return
+            if self.style.final_string:
+                self.__buffer.append(
+                    (self.style.final_string + "\n").encode(self.encoding)
+                )
+            self.flush()
+            self.__file.close()
+            rotated = _rotated_file_name(self.__log_destination)
+            os.replace(self.__log_destination, rotated)
+            self.__open_file("wb")
+            header = self.segment_header()
+            if header:
+                self.__buffer.append(header)
+                self.__buffered_bytes += len(header)
+            if self.compress or self.backup_count is not None:
+                if self.__rotation_executor is None:
+                    from concurrent.futures import ThreadPoolExecutor
+
+                    self.__rotation_executor = ThreadPoolExecutor(
+                        1, thread_name_prefix="yapl-rotation"
+                    )
+                self.__rotation_executor.submit(
+                    _finish_rotation,
+                    self.__log_destination,
+                    rotated,
+                    self.compress,
+                    self.backup_count,
+                )
+
+    def flush(self) -> None:
+        with self.write_lock:
+            if self.__flush_timer is not None:
+                self.__flush_timer.cancel()
+                self.__flush_timer = None
+            if self.__file.closed:
+                return
+            if self.__buffer:
+                self.__file.write(b"".join(self.__buffer))
+                self.__file_size += self.__buffered_bytes
+                self.__buffer.clear()
+                self.__buffered_bytes = 0
+            self.__file.flush()
+            self.__last_flush = time.monotonic()
+
+    def close(self) -> None:
+        if self.closed:
+            return
+        super().close()
+        self.__file.close()
+        if self.__rotation_executor is not None:
+            self.__rotation_executor.shutdown()
+
+    def discard(self) -> None:
+        super().discard()
+        self.__flush_timer = None
+        self.__buffer.clear()
+        self.__buffered_bytes = 0
         self.__file.close()
-        return super().__del__()
+        self.__rotation_executor = None
+
+
+class StructuredFileLogger(FileLogger):
+    """Writes the records themselves instead of formatted lines.
+
+    ``format`` is ``"jsonl"`` for one JSON object per line or ``"binary"`` for
+    the length-prefixed frames of ``yapl.structured``; ``read_records`` from
+    that module reads both back. Buffering works as in ``FileLogger``.
+    """
+
+    __encoder: "JsonLinesEncoder | BinaryRecordEncoder"
+    __encode: Callable[[Mapping[str, Any]], bytes]
+    format: "StructuredFormat"
+
+    def __init__(
+        self,
+        log_destination: str,
+        event_list: list[str] | Literal["any"],
+        format: "StructuredFormat" = "jsonl",
+        logging_callback: Callable[..., Any] | None = None,
+        ininial_callback: Callable[..., Any] | None = None,
+        destruction_callback: Callable[..., Any] | None = None,
+        **kwargs: Any,
+    ) -> None:
+        from .structured import RECORD_ENCODERS
+
+        if format not in RECORD_ENCODERS:
+            raise ValueError(
+                f"unknown structured format '{format}' (expected 'jsonl' or 'binary')"
+            )
+        self.format = format
+        self.__encoder = RECORD_ENCODERS[format]()
+        self.__encode = self.__encoder.encode
+        super().__init__(
+            log_destination,
+            basic_styles.none_style,
+            event_list,
+            logging_callback=logging_callback,
+            ininial_callback=ininial_callback,
+            destruction_callback=destruction_callback,
+            **kwargs,
+        )
+        header = self.__encoder.header()
+        if header and self.file_size == 0:
+            self.log_bytes(header)
+
+    @property
+    def required_fields(self) -> None:
+        return None
+
+    def __emit_measured(self, json: Mapping[str, Any], stats: DestinationStats) -> None:
+        with self.write_lock:
+            t0 = time.perf_counter_ns()
+            data = self.__encode(json)
+            t1 = time.perf_counter_ns()
+            self.log_bytes(data)
+        stats.log_raw.add(time.perf_counter_ns() - t1)
+        stats.formatting.add(t1 - t0)
+        stats.emitted += 1
+
+    def segment_header(self) -> bytes:
+        return self.__encoder.header()
+
+    def emit(self, json: Mapping[str, Any]) -> None:
+        if self.stats is not None:
+            self.__emit_measured(json, self.stats)
+        elif self.format == "binary":
+            # key frames have to reach the file before the records using them
+            with self.write_lock:
+                self.log_bytes(self.__encode(json))
+        else:
+            data = self.__encode(json)
+            with self.write_lock:
+                self.log_bytes(data)
+        if self.logging_callback:
+            self.logging_callback(dict(json))
+        if json["event_type"] in self.flush_events:
+            self.flush()
+
+
+class RingFileLogger(BaseLogger):
+    """Writes formatted records into a fixed-size memory-mapped ring file.
+
+    Only the newest ``ring_size`` bytes of records are kept and logging does
+    no I/O beyond copying into the mapping, so the file is cheap enough to
+    take DEBUG records in production. The pages reach the file even if the
+    process crashes; ``python -m yapl.ring FILE`` prints the records in order.
+    """
+
+    __ring: "RingFile"
+    encoding: str
+
+    def __init__(
+        self,
+        log_destination: str,
+        style: LogStyle,
+        event_list: list[str] | Literal["any"],
+        logging_callback: Callable[..., Any] | None = None,
+        ininial_callback: Callable[..., Any] | None = None,
+        destruction_callback: Callable[..., Any] | None = None,
+        ring_size: int = 16 * 1024 * 1024,
+        encoding: str = "utf-8",
+    ) -> None:
+        from .ring import RingFile
+
+        self.__ring = RingFile(log_destination, ring_size)
+        self.encoding = encoding
+        super().__init__(
+            log_destination,
+            style,
+            event_list,
+            logging_callback=logging_callback,
+            ininial_callback=ininial_callback,
+            destruction_callback=destruction_callback,
+        )
 
     def log_raw(self, raw_msg: str) -> None:
-        self.__file.write(raw_msg + "\n")
+        if not self.__ring.closed:
+            data = raw_msg.encode(self.encoding, "replace")
+            self.__ring.append(data)
+            if self.stats is not None:
+                self.stats.bytes_written += len(data)
+
+    def flush(self) -> None:
+        with self.write_lock:
+            self.__ring.flush()
+
+    def close(self) -> None:
+        if self.closed:
+            return
+        super().close()
+        self.__ring.close()
 
 
 class FunctionLogger(BaseLogger):
     __log_destination: Optional[Callable[[str], None]] = None
+    __async_callback: "Optional[AsyncCallback]" = None
 
     def __init__(
         self,
         event_list: list[str] | Literal["any"],
-        style: Optional[LogStyle] = basic_styles.none_style,
+        style: Optional[LogStyle] = None,
         logging_callback: Callable[..., Any] | None = None,
         ininial_callback: Callable[..., Any] | None = None,
         destruction_callback: Callable[..., Any] | None = None,
+        loop: "Optional[asyncio.AbstractEventLoop]" = None,
     ) -> None:
         if style is None:
             style = basic_styles.none_style
+        if logging_callback is not None:
+            from .aio import AsyncCallback, is_async_callable
+
+            if is_async_callable(logging_callback):
+                # `async def` callbacks are scheduled on the event loop
+                logging_callback = AsyncCallback(logging_callback, loop)
+                self.__async_callback = logging_callback
         if style is basic_styles.none_style:
             super().__init__(
                 None,
@@ -226,15 +1097,110 @@ class FunctionLogger(BaseLogger):
             destruction_callback=destruction_callback,
         )
 
+    @property
+    def async_callback(self) -> "Optional[AsyncCallback]":
+        return self.__async_callback
+
     def log_raw(self, raw_msg: str) -> None:
         if self.__log_destination is None:
             return
+        if self.stats is not None:
+            self.stats.bytes_written += len(raw_msg.encode("utf-8", "replace"))
         self.__log_destination(raw_msg)
 
 
+class HubLogger(BaseLogger):
+    """Sends records to a ``LogHub`` in another process instead of writing them.
+
+    Records are sent in batches: when ``batch_size`` records are waiting,
+    ``flush_interval`` seconds after the first record of a batch, right after
+    a record whose event type is in ``flush_events`` and on
+    ``flush()``/``close()``. The logger is closed when the process exits,
+    including processes started by ``multiprocessing``.
+    """
+
+    __queue: Any
+    __batch: list[dict[str, Any]]
+    __batch_lock: threading.Lock
+    __flush_timer: Optional[threading.Timer] = None
+    batch_size: int
+    flush_interval: Optional[float]
+    flush_events: tuple[str, ...]
+
+    def __init__(
+        self,
+        queue: Any,
+        event_list: list[str] | Literal["any"],
+        batch_size: int = 64,
+        flush_interval: Optional[float] = 0.1,
+        flush_events: tuple[str, ...] = ("ERROR", "CRITICAL"),
+    ) -> None:
+        self.__queue = queue
+        self.__batch = []
+        self.__batch_lock = threading.Lock()
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.flush_events = flush_events
+        super().__init__(None, basic_styles.none_style, event_list)
+        import multiprocessing.util
+
+        multiprocessing.util.Finalize(None, self.close, exitpriority=20)
+        # a process started by multiprocessing drops its finalizers after the
+        # fork hook attached it to the hub, they are registered again then
+        multiprocessing.util.register_after_fork(
+            self, HubLogger.__register_finalizer
+        )
+
+    def __register_finalizer(self) -> None:
+        import multiprocessing.util
+
+        if not self.closed:
+            multiprocessing.util.Finalize(None, self.close, exitpriority=20)
+
+    @property
+    def required_fields(self) -> None:
+        # the hub's destinations decide which fields they use
+        return None
+
+    def emit(self, json: Mapping[str, Any]) -> None:
+        if self.stats is not None:
+            self.stats.emitted += 1
+        with self.__batch_lock:
+            self.__batch.append(dict(json))
+            if (
+                len(self.__batch) >= self.batch_size
+                or json["event_type"] in self.flush_events
+            ):
+                self.__send_batch()
+            elif len(self.__batch) == 1 and self.flush_interval is not None:
+                self.__flush_timer = threading.Timer(self.flush_interval, self.flush)
+                self.__flush_timer.daemon = True
+                self.__flush_timer.start()
+
+    def __send_batch(self) -> None:
+        if self.__flush_timer is not None:
+            self.__flush_timer.cancel()
+            self.__flush_timer = None
+        if self.__batch:
+            self.__queue.put(self.__batch)
+            self.__batch = []
+
+    def log_raw(self, raw_msg: str) -> None:
+        pass
+
+    def flush(self) -> None:
+        with self.__batch_lock:
+            self.__send_batch()
+
+
 class ContaineredLogger:
     __active_loggers: dict[str | Callable, ConsoleLogger | FileLogger | FunctionLogger]
     __event_types: list[str] | Literal["any"]
+    __optional_data_gens: dict[str, Callable[[], Any]]
+    __routes: dict[str, Route]
+    __samplers: dict[str, Sampler]
+    __stats: "dict[BaseLogger, DestinationStats]"
+    __event_methods: list[str]
 
     def __init__(
         self,
@@ -242,9 +1208,20 @@ class ContaineredLogger:
             str | Callable, ConsoleLogger | FileLogger | FunctionLogger
         ],
         event_types: list[str] | Literal["any"],
+        optional_datagens: Optional[dict[str, Callable[[], Any]]] = None,
+        routes: Optional[dict[str, Route]] = None,
+        samplers: Optional[dict[str, Sampler]] = None,
+        stats: "Optional[dict[BaseLogger, DestinationStats]]" = None,
     ) -> None:
         self.__active_loggers = active_loggers
-        self.__event_types = event_types
+        self.__event_methods = []
+        self.update_event_list(event_types)
+        self.__optional_data_gens = (
+            {} if optional_datagens is None else optional_datagens
+        )
+        self.__routes = {} if routes is None else routes
+        self.__samplers = {} if samplers is None else samplers
+        self.__stats = {} if stats is None else stats
 
     def __getitem__(self, key: str) -> ConsoleLogger | FileLogger | FunctionLogger:
         return self.__active_loggers[key]
@@ -255,40 +1232,131 @@ class ContaineredLogger:
             raise AttributeError(
                 f"'{ContaineredLogger.__name__}' object has no attribute '{name}'"
             )
-
-        def lg(msg: str):
-            self.log_message(norm_name, msg)
-
+        lg = partial(self.log_message, norm_name)
+        self.__dict__[name] = lg
+        self.__event_methods.append(name)
         return lg
 
+    def update_event_list(self, new_evt_list: list[str] | Literal["any"]) -> None:
+        self.__event_types = new_evt_list
+        for name in self.__event_methods:
+            self.__dict__.pop(name, None)
+        self.__event_methods = []
+        if type(new_evt_list) != list:
+            return
+        for evt_type in new_evt_list:
+            name = event_method_name(evt_type)
+            if name is None or hasattr(ContaineredLogger, name):
+                continue
+            self.__dict__[name] = partial(self.log_message, evt_type)
+            self.__event_methods.append(name)
+
     @property
     def event_types(self) -> list[str] | Literal["any"]:
         if type(self.__event_types) == list:
             return self.__event_types.copy()
         return self.__event_types
 
-    def log_message(self, evt_type: str, msg: str) -> None:
-        for lgr in self.__active_loggers.values():
-            lgr.log_message(evt_type, msg)
+    def is_enabled(self, evt_type: str) -> bool:
+        return len(self.__route(evt_type)[0]) > 0
+
+    def __route(self, evt_type: str) -> Route:
+        return cached_route(
+            self.__routes,
+            self.__active_loggers.values(),
+            evt_type,
+            self.__optional_data_gens,
+        )
+
+    def log_message(
+        self, evt_type: str, msg: str | Callable[[], str], *args: Any, **kwargs: Any
+    ) -> None:
+        try:
+            loggers, datagens = self.__routes[evt_type]
+        except KeyError:
+            loggers, datagens = self.__route(evt_type)
+        if not loggers:
+            if self.__stats:
+                self.__count_filtered(())
+            return
+        if self.__samplers and evt_type in self.__samplers:
+            allowed, suppressed = self.__samplers[evt_type].check(sys._getframe(1))
+            if suppressed:
+                log_suppressed((loggers, datagens), evt_type, suppressed)
+            if not allowed:
+                if self.__stats:
+                    self.__count_filtered(())
+                return
+        msg = format_message(msg, args, kwargs)
+        if self.__stats:
+            self.__count_filtered(loggers)
+            self.__log_measured(evt_type, msg, loggers, datagens)
+            return
+        record = build_log_record(evt_type, msg, datagens)
+        for lgr in loggers:
+            lgr.log_json(record)
+
+    def __count_filtered(self, loggers: "tuple[BaseLogger, ...]") -> None:
+        # every destination not in `loggers` did not take the record
+        for lgr, stats in self.__stats.items():
+            if lgr not in loggers:
+                stats.filtered += 1
+
+    def __log_measured(
+        self,
+        evt_type: str,
+        msg: str,
+        loggers: "tuple[BaseLogger, ...]",
+        datagens: dict[str, Callable[[], Any]],
+    ) -> None:
+        t0 = time.perf_counter_ns()
+        record = build_log_record(evt_type, msg, datagens)
+        elapsed = time.perf_counter_ns() - t0
+        for lgr in loggers:
+            if lgr.stats is not None:
+                lgr.stats.datagens.add(elapsed)
+            lgr.log_json(record)
 
 
 class LoggerContainer:
     __passive_loggers: list[ContaineredLogger]
-    __active_loggers: dict[str | Callable, ConsoleLogger | FileLogger | FunctionLogger]
+    __active_loggers: dict[
+        str | Callable, ConsoleLogger | FileLogger | FunctionLogger | HubLogger
+    ]
     __event_types_list: list[str] | Literal["any"]
     __optional_data_gens: dict[str, Callable[[], Any]]
+    __routes: dict[str, Route]
+    __samplers: dict[str, Sampler]
+    __stats: "dict[BaseLogger, DestinationStats]"
+    __stats_enabled: bool = False
+    __stats_timer: Optional[threading.Timer] = None
+    __summary_timer: Optional[threading.Timer] = None
+    __loop: "Optional[asyncio.AbstractEventLoop]" = None
+    __async_worker_options: tuple[int, OverflowPolicy] = (1024, "block")
     __verbosity: Optional[int] = None
+    __hub: "Optional[LogHub]" = None
+    __fork_hook_registered: bool = False
 
     def __init__(self):
         self.__passive_loggers = []
         self.__active_loggers = {}
         self.__optional_data_gens = {}
+        self.__routes = {}
+        self.__samplers = {}
+        self.__stats = {}
         self.__event_types_list = basic_styles.STANDART_EVENT_TYPES
         # self.__verbosity = len(self.__event_types_list)
 
     def __call__(self):
         self.__passive_loggers.append(
-            ContaineredLogger(self.__active_loggers, self.__event_types_list)
+            ContaineredLogger(
+                self.__active_loggers,
+                self.__event_types_list,
+                self.__optional_data_gens,
+                self.__routes,
+                self.__samplers,
+                self.__stats,
+            )
         )
         return self.__passive_loggers[-1]
 
@@ -301,6 +1369,17 @@ class LoggerContainer:
             return self.__event_types_list.copy()
         return self.__event_types_list
 
+    def is_enabled(self, evt_type: str) -> bool:
+        return len(self.__route(evt_type)[0]) > 0
+
+    def __route(self, evt_type: str) -> Route:
+        return cached_route(
+            self.__routes,
+            self.__active_loggers.values(),
+            evt_type,
+            self.__optional_data_gens,
+        )
+
     @property
     def verbosity(self) -> int:
         if self.__verbosity is None:
@@ -317,6 +1396,35 @@ class LoggerContainer:
         self,
         log_destination: Literal["stdout"] | str | Callable[..., None],
         style: Optional[LogStyle] = None,
+        asynchronous: Optional[bool] = None,
+        queue_size: int = 1024,
+        overflow: OverflowPolicy = "block",
+        thread_safe: bool = False,
+        hold_records: Optional[int] = None,
+        destination_type: 'Literal["text", "ring"] | StructuredFormat' = "text",
+        **kwargs,
+    ):
+        self.__add_log_destination(log_destination, style, destination_type, **kwargs)
+        self.__active_loggers[log_destination].levels_callback = self.__routes.clear
+        if thread_safe:
+            self.__active_loggers[log_destination].thread_safe = True
+        if hold_records is not None:
+            self.__active_loggers[log_destination].hold_records(hold_records)
+        if self.__stats_enabled:
+            self.__track_stats(self.__active_loggers[log_destination])
+        self.__routes.clear()
+        if asynchronous is None and self.__loop is not None:
+            self.__active_loggers[log_destination].start_worker(
+                *self.__async_worker_options
+            )
+        elif asynchronous:
+            self.__active_loggers[log_destination].start_worker(queue_size, overflow)
+
+    def __add_log_destination(
+        self,
+        log_destination: Literal["stdout"] | str | Callable[..., None],
+        style: Optional[LogStyle] = None,
+        destination_type: 'Literal["text", "ring"] | StructuredFormat' = "text",
         **kwargs,
     ):
         if log_destination in self.__active_loggers:
@@ -335,6 +1443,26 @@ class LoggerContainer:
                 self.__optional_data_gens
             )
             return
+        if isinstance(log_destination, str) and destination_type == "ring":
+            if style is None:
+                raise ValueError(
+                    f"For destination '{log_destination}' style argument must be provided (None were given)"
+                )
+            self.__active_loggers[log_destination] = RingFileLogger(
+                log_destination, style, self.__event_types_list, **kwargs
+            )
+            self.__active_loggers[log_destination].optional_datagens.update(
+                self.__optional_data_gens
+            )
+            return
+        if isinstance(log_destination, str) and destination_type != "text":
+            self.__active_loggers[log_destination] = StructuredFileLogger(
+                log_destination, self.__event_types_list, destination_type, **kwargs
+            )
+            self.__active_loggers[log_destination].optional_datagens.update(
+                self.__optional_data_gens
+            )
+            return
         if isinstance(log_destination, str):
             if style is None:
                 raise ValueError(
@@ -347,6 +1475,7 @@ class LoggerContainer:
                 self.__optional_data_gens
             )
             return
+        kwargs.setdefault("loop", self.__loop)
         self.__active_loggers[log_destination] = FunctionLogger(
             self.__event_types_list, style, log_destination, **kwargs
         )
@@ -366,7 +1495,7 @@ class LoggerContainer:
     ) -> None:
         self.__event_types_list = new_evt_list
         for lgr in self.__passive_loggers:
-            lgr._ContaineredLogger__event_types = self.__event_types_list  # type: ignore
+            lgr.update_event_list(self.__event_types_list)
         for lgr in self.__active_loggers.values():
             lgr.event_types = self.__event_types_list
             if verbosity_levels is not None:
@@ -374,13 +1503,231 @@ class LoggerContainer:
             if self.__verbosity is None:
                 lgr.verbosity = len(new_evt_list)
 
+    def flush(self) -> None:
+        self.__log_summaries(force=True)
+        for lgr in self.__active_loggers.values():
+            if lgr.worker is not None:
+                lgr.worker.join()
+            lgr.flush()
+
+    def enable_asyncio(
+        self,
+        loop: "Optional[asyncio.AbstractEventLoop]" = None,
+        queue_size: int = 1024,
+        overflow: OverflowPolicy = "block",
+    ) -> None:
+        # every destination gets a worker so logging from coroutines never
+        # waits for I/O, `async def` destinations run on `loop` (by default
+        # the running one)
+        import asyncio
+
+        if loop is None:
+            loop = asyncio.get_running_loop()
+        self.__loop = loop
+        self.__async_worker_options = (queue_size, overflow)
+        for lgr in self.__active_loggers.values():
+            if isinstance(lgr, FunctionLogger) and lgr.async_callback is not None:
+                lgr.async_callback.loop = loop
+            lgr.start_worker(queue_size, overflow)
+
+    async def aflush(self) -> None:
+        # flush() run in an executor, then waits for the `async def`
+        # destinations to handle everything logged before
+        import asyncio
+
+        await asyncio.get_running_loop().run_in_executor(None, self.flush)
+        for lgr in list(self.__active_loggers.values()):
+            if isinstance(lgr, FunctionLogger) and lgr.async_callback is not None:
+                await lgr.async_callback.drain()
+
+    def enable_stats(
+        self, log_interval: Optional[float] = None, log_event: str = "DEBUG"
+    ) -> None:
+        # counts records and times the pipeline stages of every destination,
+        # with `log_interval` the stats() are also logged as `log_event`
+        self.__stats_enabled = True
+        for lgr in self.__active_loggers.values():
+            if lgr.stats is None:
+                self.__track_stats(lgr)
+        if self.__stats_timer is not None:
+            self.__stats_timer.cancel()
+            self.__stats_timer = None
+        if log_interval is not None:
+            self.__schedule_stats_log(log_interval, log_event)
+
+    def disable_stats(self) -> None:
+        self.__stats_enabled = False
+        if self.__stats_timer is not None:
+            self.__stats_timer.cancel()
+            self.__stats_timer = None
+        for lgr in self.__stats:
+            lgr.stats = None
+        self.__stats.clear()
+
+    def __track_stats(self, lgr: "BaseLogger") -> None:
+        lgr.stats = DestinationStats()
+        self.__stats[lgr] = lgr.stats
+
+    def stats(self) -> dict[str, dict[str, Any]]:
+        snapshot = {}
+        for dst, lgr in list(self.__active_loggers.items()):
+            if lgr.stats is None:
+                continue
+            lgr_stats = lgr.stats.snapshot()
+            worker = lgr.worker
+            lgr_stats["dropped"] = 0 if worker is None else worker.dropped_total
+            snapshot[dst if isinstance(dst, str) else repr(dst)] = lgr_stats
+        return snapshot
+
+    def __schedule_stats_log(self, log_interval: float, log_event: str) -> None:
+        self.__stats_timer = threading.Timer(
+            log_interval, self.__log_stats, (log_interval, log_event)
+        )
+        self.__stats_timer.daemon = True
+        self.__stats_timer.start()
+
+    def __log_stats(self, log_interval: float, log_event: str) -> None:
+        if not self.__stats_enabled:
+            return
+        lgr = ContaineredLogger(
+            self.__active_loggers,
+            self.__event_types_list,
+            self.__optional_data_gens,
+            self.__routes,
+            self.__samplers,
+            self.__stats,
+        )
+        for dst, lgr_stats in self.stats().items():
+            lgr.log_message(
+                log_event,
+                "{}: {} emitted, {} filtered, {} dropped, {} bytes, "
+                "formatting p50/p99 {}/{} ns, log_raw p50/p99 {}/{} ns",
+                dst,
+                lgr_stats["emitted"],
+                lgr_stats["filtered"],
+                lgr_stats["dropped"],
+                lgr_stats["bytes_written"],
+                lgr_stats["formatting"]["p50_ns"],
+                lgr_stats["formatting"]["p99_ns"],
+                lgr_stats["log_raw"]["p50_ns"],
+                lgr_stats["log_raw"]["p99_ns"],
+            )
+        self.__schedule_stats_log(log_interval, log_event)
+
+    def set_sampling(
+        self,
+        evt_type: str,
+        every: Optional[int] = None,
+        rate: Optional[float] = None,
+        burst: Optional[float] = None,
+        per_call_site: bool = False,
+        summary_interval: float = 10.0,
+    ) -> None:
+        # without `every` and `rate` sampling of the event type is turned off
+        if every is None and rate is None:
+            sampler = self.__samplers.pop(evt_type, None)
+            if sampler is not None:
+                for suppressed in sampler.pending_summaries(force=True):
+                    log_suppressed(self.__route(evt_type), evt_type, suppressed)
+        else:
+            self.__samplers[evt_type] = Sampler(
+                every, rate, burst, per_call_site, summary_interval
+            )
+        self.__schedule_summaries()
+
+    def __schedule_summaries(self) -> None:
+        # suppressed counts are also reported when the records stopped
+        if self.__summary_timer is not None:
+            self.__summary_timer.cancel()
+            self.__summary_timer = None
+        if not self.__samplers:
+            return
+        interval = min(s.summary_interval for s in self.__samplers.values())
+        self.__summary_timer = threading.Timer(interval, self.__report_summaries)
+        self.__summary_timer.daemon = True
+        self.__summary_timer.start()
+
+    def __report_summaries(self) -> None:
+        self.__log_summaries()
+        self.__schedule_summaries()
+
+    def __log_summaries(self, force: bool = False) -> None:
+        for evt_type, sampler in list(self.__samplers.items()):
+            for suppressed in sampler.pending_summaries(force):
+                log_suppressed(self.__route(evt_type), evt_type, suppressed)
+
+    @property
+    def hub(self) -> "Optional[LogHub]":
+        return self.__hub
+
+    def start_hub(self, ctx: "Optional[BaseContext]" = None) -> "LogHub":
+        # processes forked afterwards attach themselves, others have to call
+        # attach_to_hub(hub.queue) when they start
+        if self.__hub is None or not self.__hub.running:
+            from .hub import LogHub
+
+            self.__hub = LogHub(self.log_record, ctx)
+        if not self.__fork_hook_registered and hasattr(os, "register_at_fork"):
+            os.register_at_fork(after_in_child=self.__attach_forked_child)
+            self.__fork_hook_registered = True
+        return self.__hub
+
+    def __attach_forked_child(self) -> None:
+        if self.__hub is not None and self.__hub.running:
+            self.attach_to_hub(self.__hub.queue)
+
+    def attach_to_hub(
+        self, queue: Any, batch_size: int = 64, flush_interval: Optional[float] = 0.1
+    ) -> None:
+        self.__hub = None
+        for lgr in self.__active_loggers.values():
+            lgr.discard()
+        self.__active_loggers.clear()
+        self.__active_loggers[queue] = HubLogger(
+            queue, self.__event_types_list, batch_size, flush_interval
+        )
+        self.__active_loggers[queue].levels_callback = self.__routes.clear
+        self.__stats.clear()
+        if self.__stats_enabled:
+            self.__track_stats(self.__active_loggers[queue])
+        self.__routes.clear()
+
+    def log_record(self, record: Mapping[str, Any]) -> None:
+        evt_type = record["event_type"]
+        try:
+            loggers = self.__routes[evt_type][0]
+        except KeyError:
+            loggers = self.__route(evt_type)[0]
+        if not loggers:
+            return
+        record = MappingProxyType(record)
+        for lgr in loggers:
+            lgr.log_json(record)
+
     def update_optional_datagens(self, name: str, datagen: Callable[[], Any]) -> None:
         self.__optional_data_gens[name] = datagen
         for lgr in self.__active_loggers.values():
-            lgr.optional_datagens[name] = datagen
+            lgr.update_optional_datagens(name, datagen)
+        self.__routes.clear()
+
+
+_default_logger_lock = threading.Lock()
+
+
+def _create_default_logger() -> LoggerContainer:
+    default_logger = LoggerContainer()
+    default_logger.add_log_destination("stdout", basic_styles.stdout)
+    default_logger.update_optional_datagens("location", get_caller_location)
+    default_logger.update_optional_datagens("date and time", get_date_and_time)
+    return default_logger
 
 
-Logger = LoggerContainer()
-Logger.add_log_destination("stdout", basic_styles.stdout)
-Logger.update_optional_datagens("location", get_caller_location)
-Logger.update_optional_datagens("date and time", get_date_and_time)
+def __getattr__(name: str) -> Any:
+    # the default `Logger` (and its console destination) is only created
+    # when something uses it
+    if name != "Logger":
+        raise AttributeError(f"module '{__name__}' has no attribute '{name}'")
+    with _default_logger_lock:
+        if "Logger" not in globals():
+            globals()["Logger"] = _create_default_logger()
+    return globals()["Logger"]
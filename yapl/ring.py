@@ -0,0 +1,163 @@
+from typing import BinaryIO, Iterator
+import struct
+import mmap
+import sys
+import os
+
+RING_MAGIC = b"YAPLRING"
+RING_VERSION = 1
+# magic, version, header size, capacity, head, tail
+_HEADER = struct.Struct("<8sIIQQQ")
+HEADER_SIZE = 64
+_LEN = struct.Struct("<I")
+_WRAP_MARKER = 0xFFFFFFFF
+
+
+class RingFile:
+    """Fixed-size ring of length-prefixed records in a memory-mapped file.
+
+    The header stores the capacity of the data area and two ever-growing
+    logical offsets: ``head`` (where the next record goes) and ``tail`` (the
+    oldest record still in the ring). A record never wraps around the end of
+    the data area; the rest of the lap is skipped, marked with ``0xFFFFFFFF``
+    when at least a length field fits. Appending is a couple of copies into
+    the mapping and moves ``tail`` past the records it overwrites. An
+    existing ring file of the same capacity is continued, so the records of
+    a crashed run survive a restart.
+    """
+
+    __path: str
+    __file: BinaryIO
+    __map: mmap.mmap
+    __capacity: int
+    __head: int
+    __tail: int
+
+    def __init__(self, path: str, capacity: int = 16 * 1024 * 1024) -> None:
+        if capacity <= _LEN.size:
+            raise ValueError(f"ring capacity must be larger than {_LEN.size} bytes")
+        self.__path = path
+        self.__capacity = capacity
+        self.__head = 0
+        self.__tail = 0
+        self.__file = os.fdopen(os.open(path, os.O_RDWR | os.O_CREAT, 0o644), "r+b")
+        size = HEADER_SIZE + capacity
+        continued = False
+        if os.fstat(self.__file.fileno()).st_size == size:
+            magic, version, _, old_capacity, head, tail = _HEADER.unpack(
+                self.__file.read(_HEADER.size)
+            )
+            if (magic, version, old_capacity) == (RING_MAGIC, RING_VERSION, capacity):
+                self.__head, self.__tail = head, tail
+                continued = True
+        if not continued:
+            self.__file.truncate(0)
+            self.__file.truncate(size)
+        self.__map = mmap.mmap(self.__file.fileno(), size)
+        self.__write_header()
+
+    @property
+    def path(self) -> str:
+        return self.__path
+
+    @property
+    def capacity(self) -> int:
+        return self.__capacity
+
+    @property
+    def closed(self) -> bool:
+        return self.__map.closed
+
+    def __write_header(self) -> None:
+        _HEADER.pack_into(
+            self.__map,
+            0,
+            RING_MAGIC,
+            RING_VERSION,
+            HEADER_SIZE,
+            self.__capacity,
+            self.__head,
+            self.__tail,
+        )
+
+    def __reclaim(self, limit: int) -> None:
+        # moves the tail past every record that starts before `limit - capacity`
+        capacity = self.__capacity
+        ring = self.__map
+        tail = self.__tail
+        while tail < limit - capacity:
+            pos = tail % capacity
+            if capacity - pos < _LEN.size:
+                tail += capacity - pos
+                continue
+            (length,) = _LEN.unpack_from(ring, HEADER_SIZE + pos)
+            if length == _WRAP_MARKER:
+                tail += capacity - pos
+            else:
+                tail += _LEN.size + length
+        self.__tail = tail
+
+    def append(self, data: bytes) -> None:
+        capacity = self.__capacity
+        ring = self.__map
+        if len(data) > capacity - _LEN.size:
+            data = data[: capacity - _LEN.size]
+        size = _LEN.size + len(data)
+        head = self.__head
+        pos = head % capacity
+        # the header drops the overwritten records before they are touched and
+        # takes the new one only once it is complete, a crash in between never
+        # leaves a readable record with torn contents
+        if capacity - pos < size:
+            head += capacity - pos
+            self.__reclaim(head)
+            self.__write_header()
+            if capacity - pos >= _LEN.size:
+                _LEN.pack_into(ring, HEADER_SIZE + pos, _WRAP_MARKER)
+            pos = 0
+        self.__reclaim(head + size)
+        self.__write_header()
+        start = HEADER_SIZE + pos
+        ring[start + _LEN.size : start + size] = data
+        _LEN.pack_into(ring, start, len(data))
+        self.__head = head + size
+        self.__write_header()
+
+    def flush(self) -> None:
+        if not self.__map.closed:
+            self.__map.flush()
+
+    def close(self) -> None:
+        if self.__map.closed:
+            return
+        self.__map.flush()
+        self.__map.close()
+        self.__file.close()
+
+
+def read_ring(path: str) -> Iterator[bytes]:
+    """Yields the records of a ring file from the oldest to the newest."""
+    with open(path, "rb") as f:
+        ring = f.read()
+    magic, version, header_size, capacity, head, tail = _HEADER.unpack_from(ring)
+    if magic != RING_MAGIC or version != RING_VERSION:
+        raise ValueError(f"'{path}' is not a ring log file")
+    while tail < head:
+        pos = tail % capacity
+        if capacity - pos < _LEN.size:
+            tail += capacity - pos
+            continue
+        (length,) = _LEN.unpack_from(ring, header_size + pos)
+        if length == _WRAP_MARKER:
+            tail += capacity - pos
+            continue
+        start = header_size + pos + _LEN.size
+        yield ring[start : start + length]
+        tail += _LEN.size + length
+
+
+if __name__ == "__main__":
+    # prints the records of the given ring files in the order they were logged
+    for path in sys.argv[1:]:
+        for record in read_ring(path):
+            sys.stdout.write(record.decode("utf-8", "replace") + "\n")
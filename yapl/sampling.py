@@ -0,0 +1,98 @@
+from types import FrameType
+from typing import Any, Optional
+import time
+
+
+class _SiteState:
+    __slots__ = ("seen", "tokens", "refilled_at", "suppressed", "reported_at")
+
+    def __init__(self, now: float, burst: float) -> None:
+        self.seen = 0
+        self.tokens = burst
+        self.refilled_at = now
+        self.suppressed = 0
+        self.reported_at = now
+
+
+class Sampler:
+    """Lets through a sample of the records of one event type.
+
+    ``every`` passes one record in N, ``rate`` passes at most that many
+    records per second with bursts of up to ``burst`` records (a token
+    bucket); both can be combined. With ``per_call_site`` every line that
+    logs gets its own counters, otherwise the whole event type shares them.
+    Suppressed records are counted and reported by ``check`` once
+    ``summary_interval`` seconds passed since the last report; counts left
+    when the records stop are collected with ``pending_summaries``.
+    """
+
+    every: Optional[int]
+    rate: Optional[float]
+    burst: float
+    per_call_site: bool
+    summary_interval: float
+    __sites: dict[Any, _SiteState]
+
+    def __init__(
+        self,
+        every: Optional[int] = None,
+        rate: Optional[float] = None,
+        burst: Optional[float] = None,
+        per_call_site: bool = False,
+        summary_interval: float = 10.0,
+    ) -> None:
+        if every is not None and every < 1:
+            raise ValueError(f"'every' must be at least 1 ({every} were given)")
+        if rate is not None and rate <= 0:
+            raise ValueError(f"'rate' must be positive ({rate} were given)")
+        self.every = every
+        self.rate = rate
+        self.burst = max(1.0, rate or 1.0) if burst is None else burst
+        self.per_call_site = per_call_site
+        self.summary_interval = summary_interval
+        self.__sites = {}
+
+    def check(self, frame: Optional[FrameType]) -> tuple[bool, int]:
+        # returns whether the record passes and how many suppressed records
+        # are due to be reported now
+        key = (frame.f_code, frame.f_lineno) if self.per_call_site and frame else None
+        now = time.monotonic()
+        try:
+            site = self.__sites[key]
+        except KeyError:
+            site = self.__sites[key] = _SiteState(now, self.burst)
+        allowed = True
+        if self.every is not None:
+            allowed = site.seen % self.every == 0
+            site.seen += 1
+        if allowed and self.rate is not None:
+            site.tokens = min(
+                self.burst, site.tokens + (now - site.refilled_at) * self.rate
+            )
+            site.refilled_at = now
+            if site.tokens >= 1:
+                site.tokens -= 1
+            else:
+                allowed = False
+        if not allowed:
+            site.suppressed += 1
+        if site.suppressed and now - site.reported_at >= self.summary_interval:
+            suppressed = site.suppressed
+            site.suppressed = 0
+            site.reported_at = now
+            return allowed, suppressed
+        return allowed, 0
+
+    def pending_summaries(self, force: bool = False) -> list[int]:
+        # takes the suppressed counts due to be reported (all of them with
+        # `force`), one per counter that has any
+        now = time.monotonic()
+        summaries = []
+        for site in list(self.__sites.values()):
+            if site.suppressed and (
+                force or now - site.reported_at >= self.summary_interval
+            ):
+                summaries.append(site.suppressed)
+                site.suppressed = 0
+                site.reported_at = now
+        return summaries
@@ -0,0 +1,83 @@
+from typing import Any
+
+
+class Histogram:
+    """Counts durations in power-of-two nanosecond buckets.
+
+    Adding a value is a ``bit_length()`` and two increments. Percentiles are
+    read back as the upper bound of their bucket, so they are accurate to a
+    factor of two, which is enough to tell which stage got slower.
+    """
+
+    __slots__ = ("count", "total_ns", "buckets")
+
+    def __init__(self) -> None:
+        self.count = 0
+        self.total_ns = 0
+        self.buckets = [0] * 64
+
+    def add(self, ns: int) -> None:
+        self.count += 1
+        self.total_ns += ns
+        self.buckets[ns.bit_length()] += 1
+
+    def percentile(self, fraction: float) -> int:
+        if self.count == 0:
+            return 0
+        rank = fraction * self.count
+        seen = 0
+        for idx, bucket in enumerate(self.buckets):
+            seen += bucket
+            if seen >= rank:
+                return (1 << idx) - 1
+        return (1 << 63) - 1
+
+    def snapshot(self) -> dict[str, Any]:
+        return {
+            "count": self.count,
+            "total_ns": self.total_ns,
+            "mean_ns": self.total_ns / self.count if self.count else 0.0,
+            "p50_ns": self.percentile(0.5),
+            "p90_ns": self.percentile(0.9),
+            "p99_ns": self.percentile(0.99),
+        }
+
+
+class DestinationStats:
+    """Counters of one log destination, filled only while stats are enabled.
+
+    ``emitted`` records reached the destination, ``filtered`` were logged
+    with an event type it does not take (or were sampled out) and
+    ``bytes_written`` is the number of bytes it wrote: what went into the
+    file (or ring) for file destinations and the UTF-8 size of the lines
+    for the console (newlines included) and text callbacks. The histograms
+    time the datagens run for the records it got, formatting (or encoding)
+    and ``log_raw``.
+    """
+
+    __slots__ = (
+        "emitted",
+        "filtered",
+        "bytes_written",
+        "datagens",
+        "formatting",
+        "log_raw",
+    )
+
+    def __init__(self) -> None:
+        self.emitted = 0
+        self.filtered = 0
+        self.bytes_written = 0
+        self.datagens = Histogram()
+        self.formatting = Histogram()
+        self.log_raw = Histogram()
+
+    def snapshot(self) -> dict[str, Any]:
+        return {
+            "emitted": self.emitted,
+            "filtered": self.filtered,
+            "bytes_written": self.bytes_written,
+            "datagens": self.datagens.snapshot(),
+            "formatting": self.formatting.snapshot(),
+            "log_raw": self.log_raw.snapshot(),
+        }
@@ -1,5 +1,5 @@
 from typing import Optional, Literal
-import os
+from .terminal import terminal_width
 
 
 class WidthNormilizedString:
@@ -62,6 +62,7 @@ class WidthNormilizedString:
 class StickyString:
     __wn_strs: list[WidthNormilizedString]
     __wn_strs_width: list[float | int | Literal["auto"]]
+    __term_width: Optional[int] = None
 
     def __init__(self, strs: list[str], params: Optional[list[dict]] = None):
         self.__wn_strs = []
@@ -79,10 +80,9 @@ class StickyString:
             except KeyError:
                 self.__wn_strs_width.append(len(string))
             self.__wn_strs.append(WidthNormilizedString(string, **pr))
-        self.__recalculate_widths()
 
-    def __recalculate_widths(self):
-        term_width = os.get_terminal_size().columns
+    def __recalculate_widths(self, term_width: int) -> None:
+        self.__term_width = term_width
         width_left = term_width
         auto_sized_strs = []
         auto_strs_sz = 0
@@ -112,13 +112,15 @@ class StickyString:
         for key in params:
             setattr(self.__wn_strs[str_idx], key, params[key])
 
-    @property
-    def summary_string(self) -> str:
-        ret_str = ""
-        for wn_str in self.__wn_strs:
-            ret_str += wn_str.string
-        term_width = os.get_terminal_size().columns
+    def render(self, term_width: int) -> str:
+        if term_width != self.__term_width:
+            self.__recalculate_widths(term_width)
+        ret_str = "".join([wn_str.string for wn_str in self.__wn_strs])
         if len(ret_str) > term_width:
             return ret_str[: term_width - 1]
         ret_str += " " * (term_width - len(ret_str))
         return ret_str
+
+    @property
+    def summary_string(self) -> str:
+        return self.render(terminal_width.columns)
@@ -0,0 +1,81 @@
+from typing import Any, Optional
+import threading
+import weakref
+import signal
+import time
+
+FALLBACK_TERMINAL_WIDTH = 80
+
+_terminal_widths: "weakref.WeakSet[TerminalWidth]" = weakref.WeakSet()
+_sigwinch_installed = False
+
+
+def _on_sigwinch(signum: int, frame: Any, previous: Any = None) -> None:
+    for terminal_width in list(_terminal_widths):
+        terminal_width.invalidate()
+    if callable(previous):
+        previous(signum, frame)
+
+
+def _install_sigwinch_handler() -> None:
+    # signal handlers can only be set from the main thread, widths created
+    # elsewhere still pick up resizes through the refresh interval
+    global _sigwinch_installed
+    if _sigwinch_installed or not hasattr(signal, "SIGWINCH"):
+        return
+    if threading.current_thread() is not threading.main_thread():
+        return
+    previous = signal.getsignal(signal.SIGWINCH)
+    signal.signal(
+        signal.SIGWINCH,
+        lambda signum, frame: _on_sigwinch(signum, frame, previous),
+    )
+    _sigwinch_installed = True
+
+
+class TerminalWidth:
+    """Cached terminal width of stdout.
+
+    The width is queried again after a SIGWINCH or once ``refresh_interval``
+    seconds have passed since the last query. When stdout is not a terminal
+    ``fallback`` columns are reported (``COLUMNS`` from the environment
+    takes precedence, as with ``shutil.get_terminal_size``).
+    """
+
+    __columns: Optional[int] = None
+    __queried_at: float = 0.0
+    fallback: int
+    refresh_interval: float
+
+    def __init__(
+        self, fallback: int = FALLBACK_TERMINAL_WIDTH, refresh_interval: float = 1.0
+    ) -> None:
+        self.fallback = fallback
+        self.refresh_interval = refresh_interval
+        _terminal_widths.add(self)
+
+    @property
+    def columns(self) -> int:
+        columns = self.__columns
+        if (
+            columns is None
+            or time.monotonic() - self.__queried_at >= self.refresh_interval
+        ):
+            columns = self.refresh()
+        return columns
+
+    def refresh(self) -> int:
+        # shutil and the SIGWINCH handler wait until a width is needed, so
+        # importing yapl neither pays for them nor touches signal handlers
+        import shutil
+
+        _install_sigwinch_handler()
+        self.__columns = shutil.get_terminal_size((self.fallback, 24)).columns
+        self.__queried_at = time.monotonic()
+        return self.__columns
+
+    def invalidate(self) -> None:
+        self.__columns = None
+
+
+terminal_width = TerminalWidth()
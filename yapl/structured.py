@@ -0,0 +1,201 @@
+from typing import Any, BinaryIO, Iterator, Literal, Mapping
+from json.encoder import encode_basestring
+import struct
+import json
+import sys
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+StructuredFormat = Literal["jsonl", "binary"]
+
+BINARY_MAGIC = b"YAPLREC1"
+_FRAME_HEADER = struct.Struct("<BI")
+_KEY_FRAME = 0x4B
+_RECORD_FRAME = 0x52
+_U16 = struct.Struct("<H")
+_U32 = struct.Struct("<I")
+_I64 = struct.Struct("<q")
+_F64 = struct.Struct("<d")
+_I64_MIN = -(2**63)
+_I64_MAX = 2**63 - 1
+
+
+class JsonLinesEncoder:
+    """Encodes records as one compact JSON object per line.
+
+    Uses ``orjson`` when it is installed. Otherwise keys are encoded once
+    and cached, strings and ints are encoded directly and only other values
+    go through ``json``. Values JSON can't represent are written as ``str()``.
+    """
+
+    __keys: dict[str, str]
+    __encode_value: Any
+
+    def __init__(self) -> None:
+        self.__keys = {}
+        self.__encode_value = json.JSONEncoder(
+            ensure_ascii=False, separators=(",", ":"), default=str
+        ).encode
+
+    def header(self) -> bytes:
+        return b""
+
+    def encode(self, record: Mapping[str, Any]) -> bytes:
+        if orjson is not None:
+            return orjson.dumps(
+                dict(record), default=str, option=orjson.OPT_APPEND_NEWLINE
+            )
+        keys = self.__keys
+        parts = []
+        for key, val in record.items():
+            try:
+                enc_key = keys[key]
+            except KeyError:
+                enc_key = keys[key] = encode_basestring(key) + ":"
+            val_type = type(val)
+            if val_type is str:
+                parts.append(enc_key + encode_basestring(val))
+            elif val_type is int:
+                parts.append(enc_key + int.__repr__(val))
+            else:
+                parts.append(enc_key + self.__encode_value(val))
+        # lone surrogates turn into JSON escapes and keep the line valid UTF-8
+        return ("{" + ",".join(parts) + "}\n").encode("utf-8", "backslashreplace")
+
+
+class BinaryRecordEncoder:
+    """Encodes records into length-prefixed binary frames.
+
+    A stream starts with ``BINARY_MAGIC``, followed by frames made of a type
+    byte, a little-endian u32 payload length and the payload. A key frame
+    (``K``) holds a u16 id and the UTF-8 key name it stands for; it is written
+    the first time a key appears and repeated by ``header()``, so a stream
+    started later (after a rotation) knows every key. A record frame (``R``)
+    holds a u16 field count and then, per field, the key id, a type tag and
+    the value: ``s`` UTF-8 string with u32 length, ``i`` i64, ``f`` f64,
+    ``t``/``F`` booleans, ``n`` None and ``j`` JSON text with u32 length for
+    anything else.
+    """
+
+    __key_ids: dict[str, bytes]
+    __key_frames: list[bytes]
+
+    def __init__(self) -> None:
+        self.__key_ids = {}
+        self.__key_frames = []
+
+    def header(self) -> bytes:
+        return BINARY_MAGIC + b"".join(self.__key_frames)
+
+    def encode(self, record: Mapping[str, Any]) -> bytes:
+        key_ids = self.__key_ids
+        frames = []
+        parts = [_U16.pack(len(record))]
+        for key, val in record.items():
+            try:
+                key_id = key_ids[key]
+            except KeyError:
+                key_id = key_ids[key] = _U16.pack(len(key_ids))
+                enc_key = key_id + key.encode("utf-8", "surrogatepass")
+                key_frame = _FRAME_HEADER.pack(_KEY_FRAME, len(enc_key)) + enc_key
+                self.__key_frames.append(key_frame)
+                frames.append(key_frame)
+            val_type = type(val)
+            if val_type is str:
+                data = val.encode("utf-8", "surrogatepass")
+                parts += (key_id, b"s", _U32.pack(len(data)), data)
+            elif val_type is int and _I64_MIN <= val <= _I64_MAX:
+                parts += (key_id, b"i", _I64.pack(val))
+            elif val_type is float:
+                parts += (key_id, b"f", _F64.pack(val))
+            elif val_type is bool:
+                parts += (key_id, b"t" if val else b"F")
+            elif val is None:
+                parts += (key_id, b"n")
+            else:
+                data = json.dumps(val, ensure_ascii=False, default=str).encode(
+                    "utf-8", "surrogatepass"
+                )
+                parts += (key_id, b"j", _U32.pack(len(data)), data)
+        payload = b"".join(parts)
+        frames += (_FRAME_HEADER.pack(_RECORD_FRAME, len(payload)), payload)
+        return b"".join(frames)
+
+
+RECORD_ENCODERS: dict[str, type[JsonLinesEncoder] | type[BinaryRecordEncoder]] = {
+    "jsonl": JsonLinesEncoder,
+    "binary": BinaryRecordEncoder,
+}
+
+
+def _decode_record(payload: bytes, keys: dict[int, str]) -> dict[str, Any]:
+    record: dict[str, Any] = {}
+    (count,) = _U16.unpack_from(payload)
+    pos = 2
+    for _ in range(count):
+        (key_id,) = _U16.unpack_from(payload, pos)
+        tag = payload[pos + 2 : pos + 3]
+        pos += 3
+        if tag == b"s" or tag == b"j":
+            (length,) = _U32.unpack_from(payload, pos)
+            data = payload[pos + 4 : pos + 4 + length]
+            pos += 4 + length
+            val = data.decode("utf-8", "surrogatepass")
+            if tag == b"j":
+                val = json.loads(val)
+        elif tag == b"i":
+            (val,) = _I64.unpack_from(payload, pos)
+            pos += 8
+        elif tag == b"f":
+            (val,) = _F64.unpack_from(payload, pos)
+            pos += 8
+        elif tag == b"t" or tag == b"F":
+            val = tag == b"t"
+        elif tag == b"n":
+            val = None
+        else:
+            raise ValueError(f"unknown value tag {tag!r} in record frame")
+        record[keys[key_id]] = val
+    return record
+
+
+def _read_binary_records(stream: BinaryIO) -> Iterator[dict[str, Any]]:
+    keys: dict[int, str] = {}
+    while True:
+        frame_header = stream.read(_FRAME_HEADER.size)
+        if len(frame_header) < _FRAME_HEADER.size:
+            # end of the stream or a frame cut short by a crash
+            return
+        frame_type, length = _FRAME_HEADER.unpack(frame_header)
+        payload = stream.read(length)
+        if len(payload) < length:
+            return
+        if frame_type == _KEY_FRAME:
+            (key_id,) = _U16.unpack_from(payload)
+            keys[key_id] = payload[2:].decode("utf-8", "surrogatepass")
+        elif frame_type == _RECORD_FRAME:
+            yield _decode_record(payload, keys)
+        else:
+            raise ValueError(f"unknown frame type {frame_type:#x}")
+
+
+def read_records(path: str) -> Iterator[dict[str, Any]]:
+    """Streams the records of a structured log file, in either format."""
+    with open(path, "rb") as stream:
+        if stream.read(len(BINARY_MAGIC)) == BINARY_MAGIC:
+            yield from _read_binary_records(stream)
+            return
+        stream.seek(0)
+        for line in stream:
+            if line.strip():
+                yield json.loads(line)
+
+
+if __name__ == "__main__":
+    # prints the records of the given files as JSON lines
+    for path in sys.argv[1:]:
+        for record in read_records(path):
+            sys.stdout.write(json.dumps(record) + "\n")
@@ -1,4 +1,6 @@
+from typing import Callable
 from .stylingABC import LogStyle
+import re
 
 STANDART_EVENT_TYPES = ["DEBUG", "WARNING", "ERROR", "INFO", "CRITICAL"]
 
@@ -24,140 +26,253 @@ STDOUT_STANDART_MODIFIERS = {
 FILE_STANDART_MODIFIERS = {}
 
 
+# longer messages are passed through without highlighting
+PREPROCESS_MSG_MAX_LENGTH = 8192
+
+# ASCII messages are highlighted with a single regular expression that finds
+# the next highlighted span: a bracket group, a quote that does not follow a
+# letter, or a word after a space that starts with a capital, a digit or a
+# dash and ends on a character that is not a letter. Words cut short by a
+# lowercase letter, a dash, "(" or "'" are skipped unhighlighted. An unclosed
+# bracket or quote ends highlighting for the rest of the message.
+_HIGHLIGHT_SPANS = re.compile(
+    r"""
+    \((?P<brackets>[^)]*\))?
+    | '(?<![A-Za-z]')(?P<quote>[^']*')?
+    | \x20[\x20.]*+
+      (?P<word>
+        [A-Z](?:[A-Z0-9]|(?<=[A-Za-z])')*+
+        | [0-9](?:[A-Z0-9.]|(?<=[A-Za-z])')*+
+        | -(?:[A-Z0-9]|[^A-Za-z\-('])(?:[A-Z0-9]|(?<=[A-Za-z])')*+
+      )
+      (?:(?P<word_end>[^A-Za-z\-('])|(?=[a-z\-(']))
+    """,
+    re.VERBOSE,
+)
+# Outside of brackets, quotes and highlighted words only these characters can
+# change the highlighter state, so the character loop used for non-ASCII
+# messages skips everything in between.
+_HIGHLIGHT_TRIGGERS = re.compile("[(' ]")
+
+
+def _preprocess_ascii_msg(msg: str) -> str:
+    text = msg + "\0"
+    find_span = _HIGHLIGHT_SPANS.search
+    ret_parts = []
+    l_w = 0
+    span = find_span(text)
+    while span is not None:
+        span_type = span.lastgroup
+        if span_type == "word_end":
+            st_idx, end_idx = span.span("word")
+            ret_parts += (
+                msg[l_w:st_idx],
+                "\x1b[38;5;5m" if text[st_idx].isupper() else "\x1b[38;5;6m",
+                msg[st_idx:end_idx],
+                "\x1b[0m",
+                span.group("word_end"),
+            )
+            l_w = end_idx + 1
+            # a trailing space may already start the next word
+            span = find_span(text, end_idx)
+            continue
+        if span_type == "word":
+            # the word was cut short, scanning goes on from where it stopped
+            span = find_span(text, span.end())
+            continue
+        if span_type is None:
+            # unclosed bracket or quote
+            break
+        st_idx, end_idx = span.span()
+        ret_parts += (
+            msg[l_w:st_idx],
+            "\x1b[38;5;8m" if span_type == "brackets" else "\x1b[38;5;2m",
+            msg[st_idx:end_idx],
+            "\x1b[0m",
+        )
+        l_w = end_idx
+        span = find_span(text, end_idx)
+    ret_parts.append(msg[l_w:])
+    return "".join(ret_parts)
+
+
 def preprocess_msg(msg: str) -> str:
+    if len(msg) > PREPROCESS_MSG_MAX_LENGTH:
+        return msg
+    if msg.isascii():
+        return _preprocess_ascii_msg(msg)
     is_in_quote = False
     is_in_brackets = False
     is_between_spaces = False
     st_idx = -1
     l_w = 0
-    ret_str = ""
-    for i, s in enumerate(msg + "\0"):
+    ret_parts = []
+    text = msg + "\0"
+    text_len = len(text)
+    find_trigger = _HIGHLIGHT_TRIGGERS.search
+    i = 0
+    while i < text_len:
+        if is_in_brackets:
+            i = text.find(")", i)
+            if i == -1:
+                break
+        elif is_in_quote:
+            i = text.find("'", i)
+            if i == -1:
+                break
+        elif not is_between_spaces:
+            trigger = find_trigger(text, i)
+            if trigger is None:
+                break
+            i = trigger.start()
+        s = text[i]
+        i += 1
         if s == ")" and is_in_brackets:
             is_in_brackets = False
-            ret_str += (
-                msg[l_w:st_idx] + "\x1b[38;5;8m" + msg[st_idx : i + 1] + "\x1b[0m"
-            )
-            l_w = i + 1
+            ret_parts += (msg[l_w:st_idx], "\x1b[38;5;8m", msg[st_idx:i], "\x1b[0m")
+            l_w = i
             st_idx = -1
             continue
         if s == "'" and is_in_quote:
             is_in_quote = False
-            ret_str += (
-                msg[l_w:st_idx] + "\x1b[38;5;2m" + msg[st_idx : i + 1] + "\x1b[0m"
-            )
-            l_w = i + 1
+            ret_parts += (msg[l_w:st_idx], "\x1b[38;5;2m", msg[st_idx:i], "\x1b[0m")
+            l_w = i
             st_idx = -1
             continue
-        if is_in_brackets or is_in_quote:
-            continue
         if s == "(":
             is_in_brackets = True
             is_between_spaces = False
-            st_idx = i
+            st_idx = i - 1
             continue
         if s == "'":
-            if i != 0 and msg[i - 1].isalpha():
+            if i != 1 and msg[i - 2].isalpha():
                 continue
             is_in_quote = True
             is_between_spaces = False
-            st_idx = i
+            st_idx = i - 1
             continue
         if s == " " and not is_between_spaces:
             is_between_spaces = True
             continue
-        if (
-            (s.isupper() or (s.isdigit() or s == "-"))
-            and is_between_spaces
-            and st_idx == -1
-        ):
-            st_idx = i
+        is_marked = s.isupper() or s.isdigit()
+        if (is_marked or s == "-") and is_between_spaces and st_idx == -1:
+            st_idx = i - 1
             continue
         if (
-            not (
-                s.isupper()
-                or (s.isdigit() or s == "-" or (s == "." and msg[st_idx].isdigit()))
-            )
+            not (is_marked or s == "-" or (s == "." and msg[st_idx].isdigit()))
             and not s.isalpha()
             and st_idx != -1
         ):
-            if msg[i - 1] == "-":
+            if msg[i - 2] == "-":
                 continue
-            ret_str += (
-                msg[l_w:st_idx]
-                + (
+            ret_parts += (
+                msg[l_w:st_idx],
+                (
                     "\x1b[38;5;6m"
                     if (msg[st_idx].isdigit() or msg[st_idx] == "-")
                     else "\x1b[38;5;5m"
-                )
-                + msg[st_idx : i + s.isdigit()]
-                + "\x1b[0m"
-                + ("" if s.isdigit() else s)
+                ),
+                msg[st_idx : i - 1],
+                "\x1b[0m",
+                s,
             )
-            l_w = i + 1
+            l_w = i
             st_idx = -1
             if s != " ":
                 is_between_spaces = False
-        if not (s.isupper() or (s.isdigit() or s == ".")) and s != " ":
+        if not (is_marked or s == ".") and s != " ":
             is_between_spaces = False
             st_idx = -1
-    ret_str += msg[l_w:]
-    return ret_str
+    ret_parts.append(msg[l_w:])
+    return "".join(ret_parts)
+
+
+def _stdout_full_info() -> LogStyle:
+    return LogStyle(
+        "{date}{location}{event}{message}",
+        {
+            "date": "{year}-{month:02d}-{day:02d} {hour:02d}:{minute:02d}:{second:02d}.{microsecond}|",
+            "location": "\x1b[1m<{location}>\x1b[0m",
+            "event": "[{EVENT_TYPE_style_modifier}{event_type}\x1b[0m]:",
+            "message": "{EVENT_TYPE_msg_style_modifier}{message}\x1b[0m",
+        },
+        STDOUT_STANDART_MODIFIERS,
+        function_modifiers={"message": preprocess_msg},
+    )
+
+
+def _stdout() -> LogStyle:
+    return LogStyle(
+        "{location}{event}{message}",
+        {
+            "location": "\x1b[1m<{location}>\x1b[0m",
+            "event": "[{EVENT_TYPE_style_modifier}{event_type}\x1b[0m]:",
+            "message": "{EVENT_TYPE_msg_style_modifier}{message}\x1b[0m",
+        },
+        STDOUT_STANDART_MODIFIERS,
+        function_modifiers={"message": preprocess_msg},
+    )
+
+
+def _stdout_simple() -> LogStyle:
+    return LogStyle(
+        "{event}{message}",
+        {
+            "event": "[{EVENT_TYPE_style_modifier}{event_type}\x1b[0m]:",
+            "message": "{EVENT_TYPE_msg_style_modifier}{message}\x1b[0m",
+        },
+        STDOUT_STANDART_MODIFIERS,
+        function_modifiers={"message": preprocess_msg},
+    )
+
+
+def _file() -> LogStyle:
+    return LogStyle(
+        "{date}{location}{event}{message}",
+        {
+            "date": "{year}-{month:02d}-{day:02d} {hour:02d}:{minute:02d}:{second:02d}.{microsecond}|",
+            "location": "<{location}>",
+            "event": "[{event_type}]:",
+            "message": "{message}",
+        },
+        FILE_STANDART_MODIFIERS,
+    )
+
+
+def _none_style() -> LogStyle:
+    return LogStyle("", {}, {})
+
+
+# the built-in styles are compiled the first time they are used
+_STYLE_FACTORIES: dict[str, Callable[[], LogStyle]] = {
+    "stdout_full_info": _stdout_full_info,
+    "stdout": _stdout,
+    "stdout_simple": _stdout_simple,
+    "file": _file,
+    "none_style": _none_style,
+}
+
+
+def __getattr__(name: str) -> LogStyle:
+    try:
+        factory = _STYLE_FACTORIES[name]
+    except KeyError:
+        raise AttributeError(f"module '{__name__}' has no attribute '{name}'") from None
+    # setdefault keeps a single instance when threads race, styles are
+    # compared by identity
+    return globals().setdefault(name, factory())
+
+
+def __dir__() -> list[str]:
+    return sorted({*globals(), *_STYLE_FACTORIES})
 
 
-stdout_full_info = LogStyle(
-    "{date}{location}{event}{message}",
-    {
-        "date": "{year}-{month:02d}-{day:02d} {hour:02d}:{minute:02d}:{second:02d}.{microsecond}|",
-        "location": "\x1b[1m<{location}>\x1b[0m",
-        "event": "[{EVENT_TYPE_style_modifier}{event_type}\x1b[0m]:",
-        "message": "{EVENT_TYPE_msg_style_modifier}{message}\x1b[0m",
-    },
-    STDOUT_STANDART_MODIFIERS,
-    function_modifiers={"message": preprocess_msg},
-)
-stdout = LogStyle(
-    "{location}{event}{message}",
-    {
-        "location": "\x1b[1m<{location}>\x1b[0m",
-        "event": "[{EVENT_TYPE_style_modifier}{event_type}\x1b[0m]:",
-        "message": "{EVENT_TYPE_msg_style_modifier}{message}\x1b[0m",
-    },
-    STDOUT_STANDART_MODIFIERS,
-    function_modifiers={"message": preprocess_msg},
-)
-stdout_simple = LogStyle(
-    "{event}{message}",
-    {
-        "event": "[{EVENT_TYPE_style_modifier}{event_type}\x1b[0m]:",
-        "message": "{EVENT_TYPE_msg_style_modifier}{message}\x1b[0m",
-    },
-    STDOUT_STANDART_MODIFIERS,
-    function_modifiers={"message": preprocess_msg},
-)
-file = LogStyle(
-    "{date}{location}{event}{message}",
-    {
-        "date": "{year}-{month:02d}-{day:02d} {hour:02d}:{minute:02d}:{second:02d}.{microsecond}|",
-        "location": "<{location}>",
-        "event": "[{event_type}]:",
-        "message": "{message}",
-    },
-    FILE_STANDART_MODIFIERS,
-)
-none_style = LogStyle("", {}, {})
 if __name__ == "__main__":
-    from datetime import datetime
-
-    date_and_time = {}
-    date_and_time["year"] = datetime.now().year
-    date_and_time["month"] = datetime.now().month
-    date_and_time["day"] = datetime.now().day
-    date_and_time["hour"] = datetime.now().hour
-    date_and_time["minute"] = datetime.now().minute
-    date_and_time["second"] = datetime.now().second
-    date_and_time["microsecond"] = datetime.now().microsecond
+    from ..basic_datagens import get_date_and_time
+
+    date_and_time = get_date_and_time()
     print(
-        stdout_full_info.to_format_string(
+        _stdout_full_info().to_format_string(
             {
                 "location": "main.py",
                 "event_type": "INFO",
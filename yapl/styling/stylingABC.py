@@ -1,7 +1,22 @@
 from ..errors import StyleDictParseError
 from abc import ABC, abstractmethod
+from operator import itemgetter
 from string import Formatter
-from typing import Callable
+from typing import Any, Callable, Mapping
+
+
+def _escape_literal(literal: str) -> str:
+    return literal.replace("{", "{{").replace("}", "}}")
+
+
+def _format_field(idx: int, format_spec: str, conversion: str | None) -> str:
+    return (
+        "{"
+        + str(idx)
+        + ("" if conversion is None else "!" + conversion)
+        + (":" + format_spec if format_spec else "")
+        + "}"
+    )
 
 
 class LogStyleABC(ABC):
@@ -24,6 +39,12 @@ class LogStyle(LogStyleABC):
     __modifiers: dict[str, dict[str, str]]
     __function_modifiers: dict[str, Callable[[str], str]]
     __template_keys: dict[str, list[str | tuple[str, str]]]
+    __parts: list[tuple[str, list[tuple[bool, str, Any]]]]
+    __log_fmt: str
+    __flat_fmt: str | None
+    __fetch: Callable[[Mapping[str, Any]], tuple]
+    __transforms: list[tuple[int, Callable[[Any], Any]]]
+    __fields: frozenset[str]
     skip_modifiers: bool = True
     initial_string: str
     final_string: str
@@ -95,42 +116,120 @@ class LogStyle(LogStyleABC):
                     key,
                     modifier_key.lower(),
                 )
+        self.__compile()
 
-    def to_format_string(self, json_log: dict) -> str:
-        out_dct = {}
-        for i, mandatory_key in enumerate(self.__template_keys):
-            key_list = self.__template_keys[mandatory_key]
-            out_dct[mandatory_key] = ""
-            ins_dct = {}
-            for template_key in key_list:
+    def __compile(self) -> None:
+        # Every part is turned into a positional format string plus a list of
+        # field getters, so rendering a record never re-walks the templates.
+        # Modifier values are resolved (and passed through the part's function
+        # modifier) here, once, instead of on every record.
+        self.__parts = []
+        part_fmts = {}
+        keys = []
+        self.__transforms = []
+        for i, part_name in enumerate(self.__template_keys):
+            sep = "" if i == len(self.__template_keys) - 1 else " "
+            getters = []
+            part_fmt = ""
+            flat_fmt = ""
+            template_keys = iter(self.__template_keys[part_name])
+            for literal, field_name, format_spec, conversion in Formatter().parse(
+                self.__log_str_parts[part_name]
+            ):
+                part_fmt += _escape_literal(literal)
+                flat_fmt += _escape_literal(literal)
+                if field_name is None:
+                    continue
+                template_key = next(template_keys)
+                part_fmt += _format_field(len(getters), format_spec, conversion)
+                flat_fmt += _format_field(len(keys), format_spec, conversion)
                 if type(template_key) == str:
+                    transform = self.__function_modifiers.get(template_key)
+                    getters.append((False, template_key, transform))
+                    keys.append(template_key)
+                else:
+                    key_name, dep_name = template_key
+                    mod = self.__modifiers[part_name][key_name]
+                    func_mod = self.__function_modifiers.get(part_name)
+                    if func_mod is not None:
+                        mod = {dep: func_mod(val) for dep, val in mod.items()}
+                    transform = mod.__getitem__
+                    getters.append((True, dep_name, mod))
+                    keys.append(dep_name)
+                if transform is not None:
+                    self.__transforms.append((len(keys) - 1, transform))
+            self.__parts.append((part_fmt + _escape_literal(sep), getters))
+            part_fmts[part_name] = flat_fmt + _escape_literal(sep)
+        self.__fields = frozenset(keys)
+        if len(keys) == 0:
+            self.__fetch = lambda json_log: ()
+        elif len(keys) == 1:
+            key = keys[0]
+            self.__fetch = lambda json_log: (json_log[key],)
+        else:
+            self.__fetch = itemgetter(*keys)
+
+        part_idx = {part_name: i for i, part_name in enumerate(self.__template_keys)}
+        self.__log_fmt = ""
+        self.__flat_fmt = ""
+        for literal, part_name, format_spec, conversion in Formatter().parse(
+            self.__log_str
+        ):
+            self.__log_fmt += _escape_literal(literal)
+            if self.__flat_fmt is not None:
+                self.__flat_fmt += _escape_literal(literal)
+            if part_name is None:
+                continue
+            if part_name not in part_idx:
+                # rendering must fail the same way str.format(**parts) would
+                self.__log_fmt += "{" + part_name + "}"
+                self.__flat_fmt = None
+                continue
+            self.__log_fmt += _format_field(
+                part_idx[part_name], format_spec, conversion
+            )
+            if format_spec or conversion is not None:
+                self.__flat_fmt = None
+            elif self.__flat_fmt is not None:
+                self.__flat_fmt += part_fmts[part_name]
+
+    @property
+    def fields(self) -> frozenset[str]:
+        # the record fields the templates and modifiers read
+        return self.__fields
+
+    def __render_parts(self, json_log: Mapping[str, Any]) -> str:
+        out_parts = []
+        for part_fmt, getters in self.__parts:
+            values = []
+            for is_modifier, key, getter in getters:
+                if is_modifier:
                     try:
-                        ins_dct[template_key] = json_log[template_key]
-                        try:
-                            ins_dct[template_key] = self.__function_modifiers[
-                                template_key
-                            ](json_log[template_key])
-                        except KeyError:
-                            pass
-                        continue
+                        values.append(getter[json_log[key]])
                     except KeyError:
-                        break
-                key_name, dep_name = template_key
-                mod = self.__modifiers[mandatory_key][key_name]
+                        if not self.skip_modifiers:
+                            break
+                        values.append("")
+                    continue
                 try:
-                    ins_dct[key_name] = mod[json_log[dep_name]]
-                    try:
-                        ins_dct[key_name] = self.__function_modifiers[mandatory_key](
-                            ins_dct[key_name]
-                        )
-                    except KeyError:
-                        pass
+                    value = json_log[key]
                 except KeyError:
-                    if not self.skip_modifiers:
-                        break
-                    ins_dct[key_name] = ""
+                    break
+                values.append(value if getter is None else getter(value))
             else:
-                out_dct[mandatory_key] = self.__log_str_parts[mandatory_key].format(
-                    **ins_dct
-                ) + ("" if i == len(self.__template_keys) - 1 else " ")
-        return self.__log_str.format(**out_dct)
+                out_parts.append(part_fmt.format(*values))
+                continue
+            out_parts.append("")
+        return self.__log_fmt.format(*out_parts)
+
+    def to_format_string(self, json_log: Mapping[str, Any]) -> str:
+        if self.__flat_fmt is None:
+            return self.__render_parts(json_log)
+        try:
+            values = list(self.__fetch(json_log))
+            for idx, transform in self.__transforms:
+                values[idx] = transform(values[idx])
+        except KeyError:
+            # a field or modifier is missing, so some parts collapse to ""
+            return self.__render_parts(json_log)
+        return self.__flat_fmt.format(*values)
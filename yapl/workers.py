@@ -0,0 +1,134 @@
+from collections import deque
+from typing import Any, Callable, Literal, Mapping
+import threading
+
+OverflowPolicy = Literal["block", "drop_oldest", "drop_debug"]
+
+
+class LogWorker:
+    """Hands records to ``target`` on a dedicated thread through a bounded queue.
+
+    When the queue holds ``max_size`` records, ``overflow`` decides what
+    happens to the next one: ``"block"`` waits for free space,
+    ``"drop_oldest"`` discards the oldest queued record and ``"drop_debug"``
+    discards DEBUG records first (the incoming one or the oldest queued one)
+    and blocks only when there are none. Dropped records are counted per
+    event type in ``dropped``. ``stop()`` processes everything still queued
+    before the thread exits.
+    """
+
+    __target: Callable[[Mapping[str, Any]], None]
+    __queue: deque[Mapping[str, Any]]
+    __condition: threading.Condition
+    __thread: threading.Thread
+    __unfinished: int = 0
+    __stopping: bool = False
+    max_size: int
+    overflow: OverflowPolicy
+    dropped: dict[str, int]
+
+    def __init__(
+        self,
+        target: Callable[[Mapping[str, Any]], None],
+        max_size: int = 1024,
+        overflow: OverflowPolicy = "block",
+        name: str = "yapl-log-worker",
+    ) -> None:
+        if overflow not in ("block", "drop_oldest", "drop_debug"):
+            raise ValueError(
+                f"unknown overflow policy '{overflow}' (expected 'block', 'drop_oldest' or 'drop_debug')"
+            )
+        self.__target = target
+        self.__queue = deque()
+        self.__condition = threading.Condition()
+        self.max_size = max_size
+        self.overflow = overflow
+        self.dropped = {}
+        self.__thread = threading.Thread(target=self.__run, name=name, daemon=True)
+        self.__thread.start()
+
+    @property
+    def running(self) -> bool:
+        return not self.__stopping
+
+    @property
+    def dropped_total(self) -> int:
+        return sum(self.dropped.values())
+
+    def put(self, record: Mapping[str, Any]) -> None:
+        with self.__condition:
+            stopping = self.__stopping
+            if not stopping:
+                self.__enqueue(record)
+        if stopping:
+            self.__target(record)
+
+    def __enqueue(self, record: Mapping[str, Any]) -> None:
+        if (
+            len(self.__queue) >= self.max_size
+            and threading.current_thread() is not self.__thread
+            and not self.__make_room(record)
+        ):
+            return
+        self.__queue.append(record)
+        self.__unfinished += 1
+        self.__condition.notify_all()
+
+    def join(self) -> None:
+        if threading.current_thread() is self.__thread:
+            return
+        with self.__condition:
+            while self.__unfinished > 0 and self.__thread.is_alive():
+                self.__condition.wait()
+
+    def stop(self) -> None:
+        with self.__condition:
+            self.__stopping = True
+            self.__condition.notify_all()
+        if threading.current_thread() is not self.__thread:
+            self.__thread.join()
+
+    def __drop(self, record: Mapping[str, Any]) -> None:
+        evt_type = record["event_type"]
+        self.dropped[evt_type] = self.dropped.get(evt_type, 0) + 1
+
+    def __make_room(self, record: Mapping[str, Any]) -> bool:
+        # returns False when the incoming record itself was dropped
+        if self.overflow == "drop_oldest":
+            self.__drop(self.__queue.popleft())
+            self.__unfinished -= 1
+            return True
+        if self.overflow == "drop_debug":
+            if record["event_type"] == "DEBUG":
+                self.__drop(record)
+                return False
+            for i, queued in enumerate(self.__queue):
+                if queued["event_type"] == "DEBUG":
+                    del self.__queue[i]
+                    self.__drop(queued)
+                    self.__unfinished -= 1
+                    return True
+        while len(self.__queue) >= self.max_size and not self.__stopping:
+            self.__condition.wait()
+        return True
+
+    def __run(self) -> None:
+        while True:
+            with self.__condition:
+                while not self.__queue and not self.__stopping:
+                    self.__condition.wait()
+                if not self.__queue:
+                    return
+                batch = list(self.__queue)
+                self.__queue.clear()
+                self.__condition.notify_all()
+            for record in batch:
+                try:
+                    self.__target(record)
+                except Exception:
+                    import traceback
+
+                    traceback.print_exc()
+            with self.__condition:
+                self.__unfinished -= len(batch)
+                self.__condition.notify_all()